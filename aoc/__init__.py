@@ -0,0 +1,8 @@
+"""
+aoc
+
+Shared tooling for running the day_N solvers from one place.
+"""
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
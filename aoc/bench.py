@@ -0,0 +1,202 @@
+"""
+bench.py
+
+Time part_one/part_two for each day over a ladder of synthetic input sizes,
+and write the results out as JSON so scaling can be tracked over time.
+
+Each (day, part, scale) point runs in its own process: a solver that blows up
+(day 15 part two happily eats all the RAM) only loses that point, and hung
+points can be killed after --timeout seconds. Once a point fails or would
+take too long, the bigger sizes for that (day, part) are skipped.
+
+usage:
+    python -m aoc.bench                          # everything, 1x-1000x
+    python -m aoc.bench 6 7 --sizes 1,10 -o out.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from queue import Empty
+
+from aoc.cache import PARSE_CACHE_ENV, parse_cache_enabled
+from aoc.generators import FIXED_SIZE_PARTS, GENERATORS, generate
+from aoc.runner import PARTS, get_solver
+
+SIZES = (1, 10, 100, 1000)
+
+
+def measure(day: int, part: int, scale: int, repeat: int, seed: int) -> dict:
+    """Generate an input and time `repeat` runs of the solver on it.
+
+    Peak memory comes from one more run under tracemalloc, so that its
+    overhead doesn't leak into the timings.
+    """
+    input_str = generate(day, scale, seed)
+    solver = get_solver(day, part)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        answer = solver(input_str)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    solver(input_str)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "input_bytes": len(input_str),
+        "times": times,
+        "median": statistics.median(times),
+        "peak_bytes": peak_bytes,
+        "answer": str(answer),
+    }
+
+
+def _measure_worker(queue: multiprocessing.Queue, *args) -> None:
+    try:
+        queue.put(measure(*args))
+    except Exception as e:
+        queue.put({"error": repr(e)})
+
+
+def measure_in_subprocess(
+    day: int, part: int, scale: int, repeat: int, seed: int, timeout: float
+) -> dict:
+    """Run `measure` in a fresh process, killing it after `timeout` seconds."""
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_measure_worker, args=(queue, day, part, scale, repeat, seed)
+    )
+    process.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            # poll, so a process killed for running out of memory is noticed quickly.
+            try:
+                return queue.get(timeout=0.1)
+            except Empty:
+                if not process.is_alive() and queue.empty():
+                    return {"error": f"exit code {process.exitcode}"}
+                if time.monotonic() > deadline:
+                    process.kill()
+                    return {"error": "timeout"}
+    finally:
+        process.join()
+
+
+def run_ladder(
+    day: int,
+    part: int,
+    sizes: list[int],
+    repeat: int = 3,
+    seed: int = 0,
+    timeout: float = 60,
+) -> list[dict]:
+    """Benchmark one (day, part) at increasing sizes, stopping once it's too slow."""
+    if part in FIXED_SIZE_PARTS.get(day, ()):
+        sizes = [x for x in sizes if x == 1]
+
+    results = []
+    previous = None  # (scale, median) of the last successful point
+    for scale in sorted(sizes):
+        point = {"day": day, "part": part, "scale": scale}
+        # assume at least linear scaling when predicting the next point; the
+        # memory run counts as one more (slower) repeat.
+        predicted = previous and previous[1] * scale / previous[0] * (repeat + 2)
+        too_slow = predicted and predicted > timeout
+        if too_slow or any("error" in x for x in results):
+            point["skipped"] = True
+        else:
+            point |= measure_in_subprocess(day, part, scale, repeat, seed, timeout)
+            if "median" in point:
+                previous = (scale, point["median"])
+        results.append(point)
+        print(_describe(point), file=sys.stderr)
+    return results
+
+
+def _describe(point: dict) -> str:
+    name = f"day {point['day']} part {point['part']} x{point['scale']}"
+    if point.get("skipped"):
+        return f"{name}: skipped"
+    if "error" in point:
+        return f"{name}: {point['error']}"
+    return f"{name}: {point['median']:.4f}s, {point['peak_bytes'] / 2**20:.2f} MiB"
+
+
+def run_benchmarks(
+    days: list[int],
+    sizes: list[int],
+    parts: list[int] = PARTS,
+    repeat: int = 3,
+    seed: int = 0,
+    timeout: float = 60,
+) -> dict:
+    results = []
+    for day in days:
+        for part in parts:
+            results += run_ladder(day, part, sizes, repeat, seed, timeout)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sorted(sizes),
+            "repeat": repeat,
+            "seed": seed,
+            "parse_cache": parse_cache_enabled(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("--part", type=int, choices=PARTS, help="only run this part")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, SIZES)),
+        help="comma-separated input scales (default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per point")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="seconds allowed per point"
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="persist parsed inputs, so repeats only parse once",
+    )
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.parse_cache:
+        os.environ[PARSE_CACHE_ENV] = "1"
+
+    report = run_benchmarks(
+        days=args.days or sorted(GENERATORS),
+        sizes=[int(x) for x in args.sizes.split(",")],
+        parts=[args.part] if args.part else PARTS,
+        repeat=args.repeat,
+        seed=args.seed,
+        timeout=args.timeout,
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as flines:
+            flines.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
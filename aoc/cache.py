@@ -0,0 +1,225 @@
+"""
+cache.py
+
+An on-disk cache of answers, so re-running an unchanged day on an unchanged
+input is just a file read.
+
+Entries are keyed by the SHA-256 of the input text and of the day's source
+file plus the aoc modules it uses, so editing the solver, a shared helper or
+the input invalidates them. Each entry is a
+small JSON file; file modification times double as the LRU order, and the
+oldest entries are evicted once there are more than `max_entries`.
+
+The same idea is applied to parsed inputs further down.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc import REPO_ROOT
+from aoc.inputs import InputData
+
+CACHE_DIR = REPO_ROOT / ".cache" / "answers"
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# "from aoc.parsing import ...", "import aoc.inputs", "from aoc import ...".
+_AOC_IMPORT = re.compile(r"^\s*(?:from|import)\s+aoc(?:\.(\w+))?\b", re.MULTILINE)
+
+
+def code_hash(path: Path) -> str:
+    """Hash a source file along with every aoc module it imports, directly or not.
+
+    Imports are found by scanning the source rather than importing it, so
+    editing a shared helper (aoc/parsing.py, say) invalidates the entries of
+    every day that goes through it.
+    """
+    paths, todo = set(), [Path(path)]
+    while todo:
+        path = todo.pop()
+        if path in paths or not path.exists():
+            continue
+        paths.add(path)
+        for module in _AOC_IMPORT.findall(path.read_text()):
+            todo.append(REPO_ROOT / "aoc" / f"{module or '__init__'}.py")
+    return sha256(b"".join(sha256(x.read_bytes()).encode() for x in sorted(paths)))
+
+
+def source_hash(day: int) -> str:
+    """Hash the day's code without importing it (which is the slow bit)."""
+    return code_hash(REPO_ROOT / f"day_{day}" / f"day_{day}.py")
+
+
+def evict_lru(directory: Path, pattern: str, max_entries: int) -> None:
+    """Drop the least recently used files matching `pattern` beyond `max_entries`."""
+    entries = sorted(directory.glob(pattern), key=lambda x: x.stat().st_mtime)
+    for path in entries[: max(0, len(entries) - max_entries)]:
+        path.unlink(missing_ok=True)
+
+
+class AnswerCache:
+    """Answers keyed by (day, part, input hash, source hash), with LRU eviction."""
+
+    def __init__(
+        self, directory: Path = CACHE_DIR, max_entries: int = 1024, enabled=True
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.enabled = enabled  # False bypasses the cache entirely
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, day: int, part: int, input_data: InputData) -> str:
+        if isinstance(input_data, str):
+            input_data = input_data.encode()
+        input_hash = sha256(input_data)
+        return sha256(f"{day}:{part}:{input_hash}:{source_hash(day)}".encode())
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (found, answer) for `key`, and count the hit or miss."""
+        if not self.enabled:
+            return False, None
+        path = self._path(key)
+        try:
+            with open(path) as flines:
+                answer = json.load(flines)["answer"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            self.misses += 1
+            return False, None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return True, answer
+
+    def put(self, key: str, answer: Any) -> None:
+        if not self.enabled:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write then rename, so a concurrent reader never sees half an entry.
+        tmp_path = self._path(key).with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as flines:
+            json.dump({"answer": answer}, flines, default=int)  # numpy ints
+        os.replace(tmp_path, self._path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        evict_lru(self.directory, "*.json", self.max_entries)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def __str__(self) -> str:
+        return f"cache: {self.hits} hits, {self.misses} misses"
+
+
+# Parsed inputs
+#
+# Some days spend most of their time parsing (eval-ing packets, vectorising
+# chars), so parse_input functions can be wrapped with @persist_parsed to save
+# their result in .cache/parsed and reload it when the same input comes back.
+# This is opt-in, via AOC_PARSE_CACHE=1 (the runner's --parse-cache sets it),
+# so it reaches pool workers too.
+
+PARSE_CACHE_DIR = REPO_ROOT / ".cache" / "parsed"
+PARSE_CACHE_ENV = "AOC_PARSE_CACHE"
+PARSE_CACHE_MAX_ENTRIES = 64
+
+
+def parse_cache_enabled() -> bool:
+    return os.environ.get(PARSE_CACHE_ENV, "") not in ("", "0")
+
+
+def _save_npz(path: Path, result) -> None:
+    """Save an array, or a tuple of arrays and tuples (e.g. a grid plus coords)."""
+    import numpy as np
+
+    items = result if isinstance(result, tuple) else (result,)
+    kinds = [type(x).__name__ for x in items]
+    with open(path, "wb") as flines:
+        np.savez(flines, *(np.asarray(x) for x in items), kinds=np.array(kinds))
+
+
+def _load_npz(path: Path):
+    import numpy as np
+
+    with np.load(path) as data:
+        kinds = data["kinds"].tolist()
+        items = [data[f"arr_{i}"] for i in range(len(kinds))]
+    items = [
+        tuple(x.tolist()) if kind == "tuple" else x for x, kind in zip(items, kinds)
+    ]
+    return tuple(items) if len(items) > 1 else items[0]
+
+
+def _save_pickle(path: Path, result) -> None:
+    with open(path, "wb") as flines:
+        pickle.dump(result, flines, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_pickle(path: Path):
+    with open(path, "rb") as flines:
+        return pickle.load(flines)
+
+
+PARSE_FORMATS = {
+    "npz": (_save_npz, _load_npz),
+    "pickle": (_save_pickle, _load_pickle),
+}
+
+
+def persist_parsed(fmt: str = "pickle") -> Callable:
+    """Decorate a parser so its result is persisted in `fmt` and reused.
+
+    The input (text, or a bytes view of it) must be the parser's last
+    positional argument. Entries are keyed by the parser's name, its source
+    file (and the aoc modules that imports) and the input, so changing any of
+    them parses afresh.
+    """
+    save, load = PARSE_FORMATS[fmt]
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not parse_cache_enabled():
+                return func(*args, **kwargs)
+
+            input_data = args[-1]
+            if isinstance(input_data, str):
+                input_data = input_data.encode()
+            source = code_hash(Path(inspect.getsourcefile(func)))
+            key = sha256(
+                f"{func.__module__}.{func.__qualname__}:{source}:"
+                f"{sha256(input_data)}".encode()
+            )
+            path = PARSE_CACHE_DIR / f"{key}.{fmt}"
+            try:
+                result = load(path)
+                os.utime(path)
+                return result
+            except Exception:
+                # missing, or unreadable - either way, parse it again.
+                pass
+
+            result = func(*args, **kwargs)
+            PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            save(tmp_path, result)
+            os.replace(tmp_path, path)
+            evict_lru(PARSE_CACHE_DIR, f"*.{fmt}", PARSE_CACHE_MAX_ENTRIES)
+            return result
+
+        return wrapper
+
+    return decorator
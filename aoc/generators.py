@@ -0,0 +1,311 @@
+"""
+generators.py
+
+Synthetic puzzle inputs for benchmarking, one generator per day.
+
+Each generator takes a `scale` (1 is roughly the size of the real input.txt,
+10 is ten times bigger, etc.) and a seeded `random.Random`, and returns an input
+string the day's part_one/part_two will accept. The real inputs are small, so
+these are the only way to see how the solvers scale.
+"""
+import math
+import random
+import string
+
+# map from day to the parts that only make sense at scale 1, e.g. day 10's
+# screen is always exactly 40x6.
+FIXED_SIZE_PARTS = {10: (2,)}
+
+
+def day_1(scale: int, rng: random.Random) -> str:
+    """Calorie groups: ~250 elves carrying 1-15 snacks each."""
+    elves = []
+    for _ in range(250 * scale):
+        snacks = rng.choices(range(1000, 70_000), k=rng.randint(1, 15))
+        elves.append("\n".join(map(str, snacks)))
+    return "\n\n".join(elves) + "\n"
+
+
+def day_2(scale: int, rng: random.Random) -> str:
+    """Strategy guide: 2500 rounds of opponent/response pairs."""
+    rounds = 2500 * scale
+    opponent = rng.choices("ABC", k=rounds)
+    response = rng.choices("XYZ", k=rounds)
+    return "".join(f"{o} {r}\n" for o, r in zip(opponent, response))
+
+
+def _rucksack(pool: list[str], badge: str, rng: random.Random) -> str:
+    """A sack drawing from `pool`, with exactly one item in both compartments
+    and `badge` somewhere in it."""
+    shared, *rest = rng.sample(pool, len(pool))
+    left_pool, right_pool = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+    size = rng.randint(6, 24)
+    left = rng.choices(left_pool, k=size - 1) + [shared]
+    right = rng.choices(right_pool, k=size - 1) + [shared]
+    # the badge can't be in both halves, or it would also count as shared.
+    (left if rng.random() < 0.5 else right)[0] = badge
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left + right)
+
+
+def day_3(scale: int, rng: random.Random) -> str:
+    """Rucksacks in groups of three, each group sharing exactly one badge."""
+    letters = string.ascii_letters
+    sacks = []
+    for _ in range(100 * scale):
+        badge = rng.choice(letters)
+        others = rng.sample([x for x in letters if x != badge], len(letters) - 1)
+        # disjoint pools per elf, so the badge is the only item common to all three.
+        for pool in (others[0:17], others[17:34], others[34:51]):
+            sacks.append(_rucksack(pool, badge, rng))
+    return "\n".join(sacks) + "\n"
+
+
+def day_4(scale: int, rng: random.Random) -> str:
+    """Section assignment pairs with bounds in 1-99."""
+    lines = []
+    for _ in range(1000 * scale):
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        c, d = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f"{a}-{b},{c}-{d}")
+    return "\n".join(lines) + "\n"
+
+
+def day_5(scale: int, rng: random.Random) -> str:
+    """Nine towers of crates and ~500 moves, never emptying a tower."""
+    num_towers = 9
+    heights = [rng.randint(2, 8 * scale) for _ in range(num_towers)]
+    rows = []
+    for level in range(max(heights), 0, -1):
+        row = " ".join(
+            f"[{rng.choice(string.ascii_uppercase)}]" if height >= level else "   "
+            for height in heights
+        )
+        rows.append(row)
+    rows.append(" ".join(f" {i + 1} " for i in range(num_towers)))
+
+    instructions = []
+    for _ in range(500 * scale):
+        source = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        dest = rng.choice([i for i in range(num_towers) if i != source])
+        volume = rng.randint(1, heights[source] - 1)
+        heights[source] -= volume
+        heights[dest] += volume
+        instructions.append(f"move {volume} from {source + 1} to {dest + 1}")
+    return "\n".join(rows) + "\n\n" + "\n".join(instructions) + "\n"
+
+
+def day_6(scale: int, rng: random.Random) -> str:
+    """A datastream whose only markers are at the very end (the worst case)."""
+    body = rng.choices("abc", k=4096 * scale - 14)
+    return "".join(body) + "defghijklmnopq"
+
+
+def day_7(scale: int, rng: random.Random) -> str:
+    """A terminal log of cd/ls over a random tree of ~200 dirs and ~300 files.
+
+    Everything lives under one top-level directory so part two always has a
+    directory big enough to delete.
+    """
+    num_dirs = 200 * scale
+    file_size_limit = 2 * 48_000_000 // (300 * scale)
+    children: list[list[int]] = [[] for _ in range(num_dirs)]
+    for node in range(1, num_dirs):
+        children[rng.randrange(node)].append(node)
+
+    def _name(index: int) -> str:
+        return f"d{index}"
+
+    lines = ["$ cd /", "$ ls", f"dir {_name(0)}", "1234 a.txt"]
+    # (node, finished) - the second visit emits the `cd ..`.
+    stack = [(0, False)]
+    while stack:
+        node, finished = stack.pop()
+        if finished:
+            lines.append("$ cd ..")
+            continue
+        lines.append(f"$ cd {_name(node)}")
+        lines.append("$ ls")
+        lines += [f"dir {_name(child)}" for child in children[node]]
+        for i in range(rng.randint(0, 3)):
+            lines.append(f"{rng.randint(1, file_size_limit)} f{i}.dat")
+        stack.append((node, True))
+        stack += [(child, False) for child in reversed(children[node])]
+    return "\n".join(lines)
+
+
+def day_8(scale: int, rng: random.Random) -> str:
+    """A square grid of tree heights, ~99x99 at scale 1."""
+    side = round(99 * math.sqrt(scale))
+    return "\n".join("".join(rng.choices(string.digits, k=side)) for _ in range(side))
+
+
+def day_9(scale: int, rng: random.Random) -> str:
+    """2000 head moves of 1-20 steps."""
+    return "".join(
+        f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n" for _ in range(2000 * scale)
+    )
+
+
+def day_10(scale: int, rng: random.Random) -> str:
+    """A CPU program running for 240 cycles per unit of scale."""
+    lines = []
+    cycles, x = 0, 1
+    while cycles < 240 * scale:
+        if cycles == 240 * scale - 1 or rng.random() < 0.3:
+            lines.append("noop")
+            cycles += 1
+        else:
+            # keep x on (or near) the screen.
+            value = rng.randint(-5, 5) if 0 <= x <= 39 else (20 - x)
+            lines.append(f"addx {value}")
+            cycles += 2
+            x += value
+    return "\n".join(lines) + "\n"
+
+
+def day_11(scale: int, rng: random.Random) -> str:
+    """Eight monkeys with prime divisors, holding ~36 items per unit of scale."""
+    num_monkeys = 8
+    divisors = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], num_monkeys)
+    operations = ["old * old"] + [
+        f"old {rng.choice('+*')} {rng.randint(1, 19)}" for _ in range(num_monkeys - 1)
+    ]
+    rng.shuffle(operations)
+    monkeys = []
+    for i in range(num_monkeys):
+        items = rng.choices(range(50, 100), k=rng.randint(1, 8) * scale)
+        if_true, if_false = rng.sample([x for x in range(num_monkeys) if x != i], 2)
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {', '.join(map(str, items))}\n"
+            f"  Operation: new = {operations[i]}\n"
+            f"  Test: divisible by {divisors[i]}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}\n"
+        )
+    return "\n".join(monkeys)
+
+
+def day_12(scale: int, rng: random.Random) -> str:
+    """A 41x93-ish height map rising from S in one corner to E in the other.
+
+    Heights come from a smooth ramp plus smooth noise, changing by less than
+    one per step, so every square (and so E) is reachable from S.
+    """
+    rows = round(41 * math.sqrt(scale))
+    cols = round(93 * math.sqrt(scale))
+    slope = 30 / (rows + cols - 2)
+    phase_i, phase_j = rng.uniform(5, 9), rng.uniform(5, 9)
+    grid = []
+    for i in range(rows):
+        row = ""
+        for j in range(cols):
+            noise = 3 * math.sin(i / phase_i) * math.sin(j / phase_j)
+            height = min(25, max(0, math.floor(slope * (i + j) + noise)))
+            row += string.ascii_lowercase[height]
+        grid.append(row)
+    grid[0] = "S" + grid[0][1:]
+    grid[-1] = grid[-1][:-1] + "E"
+    return "\n".join(grid)
+
+
+def _packet(rng: random.Random, depth: int = 0) -> list:
+    packet = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def day_13(scale: int, rng: random.Random) -> str:
+    """150 pairs of random nested packets."""
+    pairs = []
+    for _ in range(150 * scale):
+        left, right = _packet(rng), _packet(rng)
+        pairs.append(f"{left}\n{right}".replace(" ", ""))
+    return "\n\n".join(pairs) + "\n"
+
+
+def day_14(scale: int, rng: random.Random) -> str:
+    """~180 horizontal/vertical rock paths below the sand source."""
+    spread = round(40 * math.sqrt(scale))
+    depth = round(160 * math.sqrt(scale))
+    lines = []
+    for _ in range(180 * scale):
+        x, y = rng.randint(500 - spread, 500 + spread), rng.randint(13, depth)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 6)):
+            if segment % 2:
+                y = min(depth, max(1, y + (rng.randint(-4, 4) or 1)))
+            else:
+                x += rng.randint(-6, 6) or 1
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(lines) + "\n"
+
+
+def day_15(scale: int, rng: random.Random, space_size: int = 4_000_000) -> str:
+    """A 6x6-ish lattice of sensors leaving exactly one uncovered point.
+
+    Lattice sensors with spacing s and radius s cover the whole plane. Those
+    within s of the hidden point are shrunk to just miss it, which can only
+    uncover points within 2s of it. Those are picked up by four sensors on the
+    corners of a box around the hidden point: every point in the box lies
+    between the hidden point and some corner, so is strictly closer to that
+    corner's sensor, which stops just short of the hidden point.
+    """
+    cells = round(5 * math.sqrt(scale))
+    spacing = space_size // cells
+    hidden = (rng.randint(1, space_size - 1), rng.randint(1, space_size - 1))
+
+    def _clip(value: int) -> int:
+        return min(space_size, max(0, value))
+
+    lattice = [
+        (i * spacing, j * spacing) for i in range(cells + 1) for j in range(cells + 1)
+    ]
+    box_x = (_clip(hidden[0] - 2 * spacing), _clip(hidden[0] + 2 * spacing))
+    box_y = (_clip(hidden[1] - 2 * spacing), _clip(hidden[1] + 2 * spacing))
+    corners = [(x, y) for x in box_x for y in box_y]
+
+    lines = []
+    for x, y in lattice + corners:
+        radius = min(spacing, abs(x - hidden[0]) + abs(y - hidden[1]) - 1)
+        if (x, y) in corners:
+            radius = abs(x - hidden[0]) + abs(y - hidden[1]) - 1
+        if radius < 0:
+            continue  # a lattice point landed on the hidden point itself.
+        beacon_x = x + rng.randint(-radius, radius)
+        beacon_y = y + rng.choice([-1, 1]) * (radius - abs(beacon_x - x))
+        lines.append(
+            f"Sensor at x={x}, y={y}: closest beacon is at x={beacon_x}, y={beacon_y}"
+        )
+    return "\n".join(lines)
+
+
+GENERATORS = {
+    1: day_1,
+    2: day_2,
+    3: day_3,
+    4: day_4,
+    5: day_5,
+    6: day_6,
+    7: day_7,
+    8: day_8,
+    9: day_9,
+    10: day_10,
+    11: day_11,
+    12: day_12,
+    13: day_13,
+    14: day_14,
+    15: day_15,
+}
+
+
+def generate(day: int, scale: int, seed: int = 0) -> str:
+    """Generate a synthetic input for `day`, `scale` times the real input size."""
+    return GENERATORS[day](scale, random.Random(f"{day}-{scale}-{seed}"))
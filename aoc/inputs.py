@@ -0,0 +1,58 @@
+"""
+inputs.py
+
+Zero-copy access to puzzle inputs.
+
+Reading a big input with open().read() and then splitlines() holds the file
+two or three times over before solving even starts. `mapped` instead gives a
+read-only mmap of the file, and `iter_lines` walks it a line at a time, so
+only the current line is ever decoded. Parsers written against `iter_lines`
+accept a str as well, so nothing changes for the usual string inputs.
+"""
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# anything iter_lines can walk: a decoded string, or a bytes view of a file.
+InputData = str | bytes | bytearray | mmap.mmap
+
+
+@contextmanager
+def mapped(path: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map `path` read-only for the duration of the block."""
+    with open(path, "rb") as flines:
+        # empty files can't be mapped, but there's nothing to share anyway.
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+        data = mmap.mmap(flines.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        except BaseException:
+            # arrays viewing the map can live on in the exception's traceback,
+            # and closing under them raises BufferError over the real error.
+            # They unmap it themselves once they're collected.
+            try:
+                data.close()
+            except BufferError:
+                pass
+            raise
+        data.close()
+
+
+def iter_lines(data: InputData) -> Iterator[str]:
+    """Yield each line of `data` (without its line ending), like splitlines().
+
+    Lines are found one at a time, so a str is never split into a list of
+    every line either.
+    """
+    newline = "\n" if isinstance(data, str) else b"\n"
+    start, end = 0, len(data)
+    while start < end:
+        line_end = data.find(newline, start)
+        if line_end == -1:
+            line_end = end
+        line = data[start:line_end]
+        yield (line if isinstance(line, str) else line.decode()).rstrip("\r")
+        start = line_end + 1
@@ -0,0 +1,75 @@
+"""
+parsing.py
+
+Pull every integer out of an input in one vectorised pass.
+
+Most inputs are just numbers wrapped in a bit of text ("move 3 from 1 to 2",
+"2-4,6-8", "Sensor at x=2, y=18: ..."). Rather than splitting and int()-ing
+line by line, view the whole input as a uint8 array, find the runs of digits,
+and fold each run into its value with numpy - the same handful of array ops
+whether the input has ten lines or ten million.
+"""
+import numpy as np
+
+from aoc.inputs import InputData
+
+_ZERO, _NINE, _MINUS = ord("0"), ord("9"), ord("-")
+_MAX_DIGITS = 18  # int64 holds any 18-digit number
+
+
+def _check_per_line(chars: np.ndarray, starts: np.ndarray, per_line: int) -> None:
+    """Raise unless every non-blank line holds exactly `per_line` integers."""
+    newlines = np.flatnonzero(chars == ord("\n"))
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_ends = np.concatenate((newlines, [len(chars)]))
+    # a line is blank if it has nothing but whitespace.
+    printable = np.concatenate(([0], np.cumsum(chars > ord(" "), dtype=np.int64)))
+    non_blank = printable[line_ends] > printable[line_starts]
+
+    counts = np.bincount(np.searchsorted(newlines, starts), minlength=len(line_starts))
+    if np.any(counts[non_blank] != per_line):
+        raise ValueError(f"expected {per_line} integers on every line")
+
+
+def extract_ints(
+    input_data: InputData, per_line: int | None = None, signed: bool = False
+) -> np.ndarray:
+    """Return every integer in `input_data` as an int64 array, in order.
+
+    Args:
+        input_data: the text, or a bytes view of it (e.g. from aoc.inputs.mapped).
+        per_line: if given, reshape to (number of lines, per_line) - every
+            non-blank line must then hold exactly that many integers.
+        signed: treat a "-" directly before a number as a minus sign. Leave this
+            off for inputs using "-" as a separator, like "2-4".
+    """
+    if isinstance(input_data, str):
+        input_data = input_data.encode()
+    chars = np.frombuffer(input_data, dtype=np.uint8)
+
+    is_digit = (chars >= _ZERO) & (chars <= _NINE)
+    # pad either side so runs touching the ends still get a start and an end.
+    edges = np.diff(np.concatenate(([False], is_digit, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)  # one past the last digit
+    lengths = ends - starts
+    if per_line is not None:
+        _check_per_line(chars, starts, per_line)
+    if not len(lengths):
+        return np.zeros((0, per_line) if per_line else 0, dtype=np.int64)
+    if lengths.max() > _MAX_DIGITS:
+        raise ValueError("integer too large for int64")
+
+    # each digit's place value is 10 ** (digits left in its run).
+    digits = chars[is_digit].astype(np.int64) - _ZERO
+    place = np.repeat(ends, lengths) - np.flatnonzero(is_digit) - 1
+    values = np.add.reduceat(digits * 10**place, np.cumsum(lengths) - lengths)
+
+    if signed:
+        has_sign = np.zeros(len(starts), dtype=bool)
+        has_sign[starts > 0] = chars[starts[starts > 0] - 1] == _MINUS
+        values[has_sign] *= -1
+
+    if per_line is not None:
+        values = values.reshape(-1, per_line)
+    return values
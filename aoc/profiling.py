@@ -0,0 +1,103 @@
+"""
+profiling.py
+
+Run a day's part under cProfile and tracemalloc, to find out why it's slow
+without wrapping it by hand.
+
+Each (day, part) gets a .prof file (for snakeviz, pstats, etc.), a table of
+the top functions by own time, and the peak memory traced while solving.
+"""
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import REPO_ROOT
+from aoc.inputs import InputData, mapped
+from aoc.runner import (
+    JobResult,
+    accepts_bytes,
+    format_answer,
+    get_solver,
+    input_path,
+    read_input,
+)
+
+PROFILE_DIR = REPO_ROOT / "profiles"
+
+
+@dataclass
+class ProfileReport(JobResult):
+    """A JobResult plus where the time and memory went."""
+
+    peak_bytes: int = 0
+    prof_path: Path | None = None
+    hotspots: str = ""
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"day {self.day} part {self.part}: {format_answer(self.answer)}",
+                f"  time (profiled): {self.seconds:.3f}s",
+                f"  peak memory: {self.peak_bytes / 2**20:.2f} MiB",
+                f"  profile: {self.prof_path}",
+                self.hotspots,
+            ]
+        )
+
+
+def profile_solve(
+    day: int,
+    part: int,
+    input_str: str | None = None,
+    top: int = 15,
+    output_dir: Path = PROFILE_DIR,
+    use_mmap: bool = False,
+) -> ProfileReport:
+    """Solve one part under the profilers, and dump its stats to `output_dir`."""
+    if input_str is None and use_mmap and accepts_bytes(day):
+        with mapped(input_path(day)) as data:
+            return _profile(day, part, data, top, output_dir)
+    if input_str is None:
+        input_str = read_input(day)
+    return _profile(day, part, input_str, top, output_dir)
+
+
+def _profile(
+    day: int, part: int, input_data: InputData, top: int, output_dir: Path
+) -> ProfileReport:
+    # import outside the profiled region, so we only see the solving.
+    solver = get_solver(day, part)
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        answer = solver(input_data)
+    finally:
+        profiler.disable()
+        seconds = time.perf_counter() - start
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    prof_path = output_dir / f"day_{day}_part_{part}.prof"
+    profiler.dump_stats(prof_path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).strip_dirs()
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    return ProfileReport(
+        day,
+        part,
+        answer,
+        seconds,
+        peak_bytes=peak_bytes,
+        prof_path=prof_path,
+        hotspots=stream.getvalue().strip("\n"),
+    )
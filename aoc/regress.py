@@ -0,0 +1,184 @@
+"""
+regress.py
+
+Check a solver hasn't got slower (or hungrier): re-run the benchmark ladder
+and compare each (day, part, scale) point against a committed baseline.
+
+A point regresses when its median time or peak memory grows by more than the
+threshold, or when it used to succeed and now fails. Points faster than
+--min-seconds (or using under 64 KiB) in the baseline are too noisy to judge
+on that measure.
+
+usage:
+    python -m aoc.regress --update       # record a new baseline
+    python -m aoc.regress 7 8            # compare days 7 and 8, exit 1 on regression
+"""
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import REPO_ROOT
+from aoc.bench import run_benchmarks
+
+BASELINE_PATH = REPO_ROOT / "benchmarks" / "baseline.json"
+
+
+@dataclass
+class Comparison:
+    """How one (day, part, scale) point moved relative to the baseline."""
+
+    day: int
+    part: int
+    scale: int
+    baseline: dict
+    current: dict
+    regressions: list[str]
+
+    @property
+    def regressed(self) -> bool:
+        return bool(self.regressions)
+
+    def __str__(self) -> str:
+        name = f"day {self.day} part {self.part} x{self.scale}"
+        if "error" in self.current:
+            return f"{name}: {self.current['error']} (REGRESSED)"
+        time_change = _change(self.baseline["median"], self.current["median"])
+        memory_change = _change(self.baseline["peak_bytes"], self.current["peak_bytes"])
+        status = (
+            f" (REGRESSED: {', '.join(self.regressions)})" if self.regressed else ""
+        )
+        return (
+            f"{name}: time {self.baseline['median']:.4f}s -> "
+            f"{self.current['median']:.4f}s ({time_change:+.0%}), "
+            f"memory {self.baseline['peak_bytes'] / 2**20:.2f} -> "
+            f"{self.current['peak_bytes'] / 2**20:.2f} MiB ({memory_change:+.0%})"
+            f"{status}"
+        )
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old if old else 0.0
+
+
+def _points(report: dict) -> dict[tuple[int, int, int], dict]:
+    return {(x["day"], x["part"], x["scale"]): x for x in report["results"]}
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.25,
+    memory_threshold: float = 0.25,
+    min_seconds: float = 0.005,
+    min_bytes: int = 64 * 1024,
+) -> list[Comparison]:
+    """Compare every point measured in both reports.
+
+    Points that were skipped or failed in the baseline have nothing to compare
+    against, and are left out. Baseline points under `min_seconds` or
+    `min_bytes` are too small to judge on that measure.
+    """
+    comparisons = []
+    baseline_points = _points(baseline)
+    for key, point in sorted(_points(current).items()):
+        before = baseline_points.get(key)
+        if before is None or "median" not in before or point.get("skipped"):
+            continue
+        regressions = []
+        if "error" in point:
+            regressions.append("failed")
+        else:
+            if (
+                before["median"] >= min_seconds
+                and _change(before["median"], point["median"]) > threshold
+            ):
+                regressions.append("time")
+            if (
+                before["peak_bytes"] >= min_bytes
+                and _change(before["peak_bytes"], point["peak_bytes"])
+                > memory_threshold
+            ):
+                regressions.append("memory")
+        comparisons.append(Comparison(*key, before, point, regressions))
+    return comparisons
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--update", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--sizes", help="comma-separated input scales (default: the baseline's)"
+    )
+    parser.add_argument("--repeat", type=int, help="runs per point")
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="seconds allowed per point"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed fractional slowdown (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.25,
+        help="allowed fractional peak memory growth (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.005,
+        help="ignore timings of points faster than this in the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if not args.update:
+        if not args.baseline.exists():
+            sys.exit(f"no baseline at {args.baseline}, record one with --update")
+        with open(args.baseline) as flines:
+            baseline = json.load(flines)
+
+    # by default, re-run exactly what the baseline measured.
+    meta = baseline["meta"] if baseline else {}
+    baseline_days = sorted({x["day"] for x in baseline["results"]}) if baseline else []
+    sizes = args.sizes or ",".join(map(str, meta.get("sizes", [1, 10])))
+    report = run_benchmarks(
+        days=args.days or baseline_days or list(range(1, 16)),
+        sizes=[int(x) for x in sizes.split(",")],
+        repeat=args.repeat or meta.get("repeat", 3),
+        seed=meta.get("seed", 0),
+        timeout=args.timeout,
+    )
+
+    if args.update:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w") as flines:
+            flines.write(json.dumps(report, indent=2) + "\n")
+        print(f"wrote baseline to {args.baseline}")
+        return
+
+    comparisons = compare(
+        baseline,
+        report,
+        threshold=args.threshold,
+        memory_threshold=args.memory_threshold,
+        min_seconds=args.min_seconds,
+    )
+    for comparison in comparisons:
+        print(comparison)
+    regressed = [x for x in comparisons if x.regressed]
+    if regressed:
+        sys.exit(f"{len(regressed)} of {len(comparisons)} points regressed")
+    print(f"no regressions in {len(comparisons)} points")
+
+
+if __name__ == "__main__":
+    main()
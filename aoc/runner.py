@@ -0,0 +1,252 @@
+"""
+runner.py
+
+Discover the day_N packages and run their solvers from a single entry point.
+
+Day modules are only imported when a day is actually requested, so solving one
+day doesn't pay for importing (numpy, networkx, ...) the other fourteen. The
+worked examples now live in each module's `self_check()`, which is run with
+--check rather than at import time.
+
+usage:
+    python -m aoc               # solve every day
+    python -m aoc 6 7 --part 2  # solve part two of days 6 and 7
+    python -m aoc --check       # run the worked examples instead
+    python -m aoc -j 8          # fan every (day, part) out over 8 processes
+    python -m aoc --no-cache    # recompute, even if the answer is cached
+    python -m aoc --parse-cache # reuse parsed inputs from earlier runs
+    python -m aoc 14 --profile  # cProfile/tracemalloc report, .prof files in profiles/
+"""
+import argparse
+import functools
+import importlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc import REPO_ROOT
+from aoc.cache import PARSE_CACHE_ENV, AnswerCache
+from aoc.inputs import mapped
+
+PARTS = (1, 2)
+PART_NAMES = {1: "part_one", 2: "part_two"}
+
+
+def discover_days() -> list[int]:
+    """Return the day numbers with a day_N/day_N.py solver, in order."""
+    days = []
+    for path in REPO_ROOT.glob("day_*"):
+        match = re.fullmatch(r"day_(\d+)", path.name)
+        if match and (path / f"{path.name}.py").is_file():
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def load_day(day: int) -> ModuleType:
+    """Import (or fetch the already-imported) module for `day`."""
+    return importlib.import_module(f"day_{day}.day_{day}")
+
+
+def get_solver(day: int, part: int) -> Callable:
+    """Return part_one or part_two for the given day."""
+    return getattr(load_day(day), PART_NAMES[part])
+
+
+def input_path(day: int) -> Path:
+    return REPO_ROOT / f"day_{day}" / "input.txt"
+
+
+def read_input(day: int) -> str:
+    with open(input_path(day)) as flines:
+        return flines.read()
+
+
+def accepts_bytes(day: int) -> bool:
+    """True if the day's parsers can walk an mmap of the input (see aoc.inputs)."""
+    return getattr(load_day(day), "ACCEPTS_BYTES", False)
+
+
+def solve(day: int, part: int, input_str: str | None = None, use_mmap: bool = False):
+    """Run a single part of a day, on its input.txt unless told otherwise.
+
+    With `use_mmap`, days whose parsers walk lines with aoc.inputs.iter_lines
+    (marked by ACCEPTS_BYTES) are handed a memory map of input.txt rather than
+    its decoded text.
+    """
+    solver = get_solver(day, part)
+    if input_str is None and use_mmap and accepts_bytes(day):
+        with mapped(input_path(day)) as data:
+            return solver(data)
+    if input_str is None:
+        input_str = read_input(day)
+    return solver(input_str)
+
+
+@dataclass
+class JobResult:
+    """The answer to one (day, part), and how long it took."""
+
+    day: int
+    part: int
+    answer: Any
+    seconds: float
+    cached: bool = False
+
+
+def timed_solve(
+    day: int, part: int, input_str: str | None = None, use_mmap: bool = False
+) -> JobResult:
+    get_solver(day, part)  # import the day (and numpy etc.) outside the timing
+    start = time.perf_counter()
+    answer = solve(day, part, input_str, use_mmap)
+    return JobResult(day, part, answer, time.perf_counter() - start)
+
+
+def run_jobs(
+    jobs: list[tuple[int, int]],
+    inputs: dict[int, str] | None = None,
+    workers: int = 1,
+    cache: AnswerCache | None = None,
+    solve_func: Callable[..., JobResult] = timed_solve,
+) -> list[JobResult]:
+    """Solve each (day, part) in `jobs`, returning results in the same order.
+
+    With more than one worker the jobs are fanned out over a process pool, so
+    the whole run takes about as long as the slowest job. `inputs` maps day to
+    input text; days without an entry read their own input.txt. Answers found
+    in `cache` aren't recomputed, and new answers are added to it.
+
+    `solve_func(day, part, input_str)` does the solving - e.g. swap in
+    aoc.profiling.profile_solve to profile each job.
+    """
+    inputs = inputs or {}
+    results: list[JobResult | None] = [None] * len(jobs)
+    keys = {}
+    to_solve = []  # indices into jobs
+    for i, (day, part) in enumerate(jobs):
+        if cache is None or not cache.enabled:
+            to_solve.append(i)
+            continue
+        if day in inputs:
+            keys[i] = cache.key(day, part, inputs[day])
+        else:
+            # hash input.txt through a map; the solver reads it for itself.
+            with mapped(input_path(day)) as data:
+                keys[i] = cache.key(day, part, data)
+        found, answer = cache.get(keys[i])
+        if found:
+            results[i] = JobResult(day, part, answer, 0.0, cached=True)
+        else:
+            to_solve.append(i)
+
+    if workers == 1:
+        solved = [solve_func(*jobs[i], inputs.get(jobs[i][0])) for i in to_solve]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(solve_func, *jobs[i], inputs.get(jobs[i][0]))
+                for i in to_solve
+            ]
+            solved = [future.result() for future in futures]
+
+    for i, result in zip(to_solve, solved):
+        results[i] = result
+        if i in keys:
+            cache.put(keys[i], result.answer)
+    return results
+
+
+def self_check(day: int) -> None:
+    """Run the worked examples for `day`. Raises AssertionError on failure."""
+    load_day(day).self_check()
+
+
+def format_answer(answer) -> str:
+    # day 10 part two draws a screen, so give it its own lines.
+    answer = str(answer)
+    return "\n" + answer if "\n" in answer else answer
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("--part", type=int, choices=PARTS, help="only run this part")
+    parser.add_argument(
+        "--check", action="store_true", help="run the worked examples instead"
+    )
+    parser.add_argument(
+        "--input", type=Path, help="solve this file instead of input.txt"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="solve (day, part)s in parallel over this many processes",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="bypass the on-disk answer cache"
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="persist parsed inputs in .cache/parsed and reuse them",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="hand line-based days a memory map of their input instead of a str",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="run each part under cProfile and tracemalloc (skips the answer cache)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="hotspots to list with --profile"
+    )
+    args = parser.parse_args(argv)
+
+    if args.parse_cache:
+        os.environ[PARSE_CACHE_ENV] = "1"  # an env var, so pool workers see it too
+    days = args.days or discover_days()
+    parts = [args.part] if args.part else list(PARTS)
+
+    if args.check:
+        for day in days:
+            self_check(day)
+            print(f"day {day}: ok")
+        return
+
+    inputs = {day: args.input.read_text() for day in days} if args.input else None
+    jobs = [(day, part) for day in days for part in parts]
+    if args.profile:
+        from aoc.profiling import profile_solve
+
+        solve_func = functools.partial(profile_solve, top=args.top, use_mmap=args.mmap)
+        for report in run_jobs(jobs, inputs, workers=args.jobs, solve_func=solve_func):
+            print(report)
+        return
+
+    cache = AnswerCache(enabled=not args.no_cache)
+    solve_func = functools.partial(timed_solve, use_mmap=args.mmap)
+    for result in run_jobs(
+        jobs, inputs, workers=args.jobs, cache=cache, solve_func=solve_func
+    ):
+        timing = "cached" if result.cached else f"{result.seconds:.3f}s"
+        print(
+            f"day {result.day} part {result.part} ({timing}):",
+            format_answer(result.answer),
+        )
+    if cache.enabled:
+        print(cache, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+service.py
+
+Solve a whole team's inputs at once: an asyncio front end that takes a stream
+of (day, part, input file) jobs, runs the solvers on a process pool, and
+streams the answers back as they finish.
+
+A job only goes to the pool once a worker is free, so the pool never builds
+up a backlog, and each day can only hold `per_day` workers at a time - a pile
+of day 15 part twos can't stop the day 2s and day 6s behind them getting a
+worker.
+
+usage:
+    python -m aoc.service inputs/ --workers 8 --per-day 2
+
+where inputs/ holds files named after their day, e.g. inputs/alice/day_6.txt.
+Results are printed as JSON lines, in completion order.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Iterable
+
+from aoc.runner import PARTS, JobResult, timed_solve
+
+
+@dataclass(frozen=True)
+class SolveJob:
+    day: int
+    part: int
+    path: Path
+
+
+@dataclass
+class JobOutcome:
+    """Either the result of a job, or the error it raised."""
+
+    job: SolveJob
+    result: JobResult | None = None
+    error: str | None = None
+
+    def to_json(self) -> str:
+        output = {
+            "path": str(self.job.path),
+            "day": self.job.day,
+            "part": self.job.part,
+        }
+        if self.result is not None:
+            output |= {"answer": self.result.answer, "seconds": self.result.seconds}
+        else:
+            output["error"] = self.error
+        return json.dumps(output, default=str)
+
+
+def jobs_from_directory(
+    directory: Path, parts: Iterable[int] = PARTS
+) -> list[SolveJob]:
+    """One job per part for every file under `directory` named like day_N*."""
+    jobs = []
+    for path in sorted(Path(directory).rglob("*")):
+        match = re.match(r"day_?(\d+)", path.name)
+        if match and path.is_file():
+            jobs += [SolveJob(int(match.group(1)), part, path) for part in parts]
+    return jobs
+
+
+async def jobs_from_queue(queue: asyncio.Queue) -> AsyncIterator[SolveJob]:
+    """Yield jobs put on `queue` until someone puts None."""
+    while (job := await queue.get()) is not None:
+        yield job
+
+
+async def _as_async(jobs: Iterable | AsyncIterable) -> AsyncIterator[SolveJob]:
+    if isinstance(jobs, AsyncIterable):
+        async for job in jobs:
+            yield job
+    else:
+        for job in jobs:
+            yield job
+
+
+def _solve_file(day: int, part: int, path: str) -> JobResult:
+    # read in the worker, rather than pickling every input over to it.
+    with open(path) as flines:
+        return timed_solve(day, part, flines.read())
+
+
+class BatchSolver:
+    """Runs SolveJobs on a process pool, limiting how many workers each day gets."""
+
+    def __init__(self, workers: int | None = None, per_day: int | None = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.per_day = per_day or max(1, self.workers // 2)
+
+    async def solve(
+        self, jobs: Iterable[SolveJob] | AsyncIterable[SolveJob]
+    ) -> AsyncIterator[JobOutcome]:
+        """Yield an outcome for every job, in the order they finish."""
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        free_workers = asyncio.Semaphore(self.workers)
+        day_slots = defaultdict(lambda: asyncio.Semaphore(self.per_day))
+        outcomes: asyncio.Queue[JobOutcome | None] = asyncio.Queue()
+
+        async def _run(job: SolveJob) -> None:
+            # take the day's slot first, so a job waiting on its day doesn't
+            # hold a worker that another day could use.
+            async with day_slots[job.day], free_workers:
+                try:
+                    result = await loop.run_in_executor(
+                        executor, _solve_file, job.day, job.part, str(job.path)
+                    )
+                    outcome = JobOutcome(job, result)
+                except Exception as e:
+                    outcome = JobOutcome(job, error=repr(e))
+            await outcomes.put(outcome)
+
+        async def _feed() -> None:
+            running = []
+            async for job in _as_async(jobs):
+                running.append(asyncio.create_task(_run(job)))
+            await asyncio.gather(*running)
+            await outcomes.put(None)
+
+        feeder = asyncio.create_task(_feed())
+        try:
+            while (outcome := await outcomes.get()) is not None:
+                yield outcome
+            await feeder
+        finally:
+            feeder.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _main(directory: Path, workers: int, per_day: int, parts: list[int]) -> None:
+    solver = BatchSolver(workers, per_day)
+    async for outcome in solver.solve(jobs_from_directory(directory, parts)):
+        print(outcome.to_json(), flush=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("directory", type=Path, help="directory of day_N input files")
+    parser.add_argument("--workers", type=int, help="pool size (default: all cores)")
+    parser.add_argument(
+        "--per-day", type=int, help="max workers per day (default: half the pool)"
+    )
+    parser.add_argument("--part", type=int, choices=PARTS, help="only run this part")
+    args = parser.parse_args(argv)
+
+    parts = [args.part] if args.part else list(PARTS)
+    asyncio.run(_main(args.directory, args.workers, args.per_day, parts))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,34 +2,184 @@
 
 Given a list of ints for each Elf, separate by blank lines,
 get the max total.
+
+Only each elf's total matters, so the input is streamed a line at a time and
+never held as lists: elf_totals yields one running sum per elf, and top_k
+keeps the k biggest in a k-sized heap - O(k) memory over any size of input.
+
+For really big files, parallel_top_k splits the file into line-aligned byte
+ranges and totals them on a process pool, stitching together the elves that
+straddle two ranges.
 """
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, Iterator
 
+from aoc.inputs import InputData, iter_lines, mapped
 
-def parse_input(input_path: str) -> list[list[int]]:
-    with open(input_path) as flines:
-        input_data = []
-        current_list = []
-        for line in flines:
-            if line.strip():
-                current_list.append(int(line.strip()))
-            else:
-                input_data.append(current_list)
-                current_list = []
+ACCEPTS_BYTES = True
+CHUNK_BYTES = 1 << 24
 
-    return input_data
 
+def elf_totals(input_str: InputData) -> Iterator[int]:
+    """Yield the total calories carried by each elf, in order."""
+    total = None
+    for line in iter_lines(input_str):
+        if line.strip():
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+    # the last elf needn't be followed by a blank line.
+    if total is not None:
+        yield total
 
-if __name__ == "__main__":
 
-    input_data = parse_input("input.txt")
+def _push(heap: list[int], total: int, k: int) -> None:
+    """Add `total` to a min-heap holding the biggest k totals seen so far."""
+    if len(heap) < k:
+        heapq.heappush(heap, total)
+    elif total > heap[0]:
+        heapq.heapreplace(heap, total)
+
+
+def _largest(totals: Iterable[int], k: int) -> list[int]:
+    heap = []
+    for total in totals:
+        _push(heap, total, k)
+    return sorted(heap, reverse=True)
+
+
+def top_k(input_str: InputData, k: int) -> list[int]:
+    """The k biggest elf totals, biggest first."""
+    return _largest(elf_totals(input_str), k)
+
+
+@dataclass
+class ChunkTotals:
+    """What one byte range of the input adds to the elf totals.
+
+    The first and last groups of lines may be elves carrying on into the
+    neighbouring ranges, so they're kept apart as `head` and `tail` (None if
+    there are no lines there). If the range has no blank line at all, it's
+    all one group, held in `head`.
+    """
+
+    head: int | None
+    top: list[int]  # the biggest k elves wholly inside the range
+    tail: int | None
+    has_break: bool
+
+
+def chunk_bounds(
+    data: InputData, chunk_bytes: int = CHUNK_BYTES
+) -> list[tuple[int, int]]:
+    """Split `data` into (start, end) ranges of about `chunk_bytes`, on line ends."""
+    bounds = []
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + chunk_bytes - 1) + 1 or len(data)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def chunk_totals(path: str, start: int, end: int, k: int) -> ChunkTotals:
+    """Total up the elves in bytes [start, end) of the file at `path`."""
+    with mapped(path) as data:
+        chunk = data[start:end]
+
+    # a chunk is small enough to decode whole, and splitlines beats iter_lines.
+    head, top, total, has_break = None, [], None, False
+    for line in chunk.decode().splitlines():
+        if line.strip():
+            total = (total or 0) + int(line)
+            continue
+        if not has_break:
+            head, has_break = total, True
+        elif total is not None:
+            _push(top, total, k)
+        total = None
+    if not has_break:
+        return ChunkTotals(total, [], None, False)
+    return ChunkTotals(head, sorted(top, reverse=True), total, True)
 
-    # part one - get the max
-    max_cals = max(sum(x) for x in input_data)
-    print("max:", max_cals)
 
-    # part two - get the sum of the top three
+def merge_chunks(chunks: Iterable[ChunkTotals], k: int) -> list[int]:
+    """Stitch per-range totals (in file order) back together into the top k."""
+    heap = []
+    carry = None  # the elf running on from the previous range
+    for chunk in chunks:
+        if chunk.head is not None:
+            carry = (carry or 0) + chunk.head
+        if not chunk.has_break:
+            continue
+        if carry is not None:
+            _push(heap, carry, k)
+        for total in chunk.top:
+            _push(heap, total, k)
+        carry = chunk.tail
+    if carry is not None:
+        _push(heap, carry, k)
+    return sorted(heap, reverse=True)
 
-    sorted_input = sorted(input_data, key=sum)
 
-    top_three_cals = sum(sum(x) for x in sorted_input[-3:])
-    print("top three sum:", top_three_cals)
+def parallel_top_k(
+    path: str | Path,
+    k: int,
+    workers: int | None = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> list[int]:
+    """top_k for the file at `path`, with its byte ranges totalled in parallel."""
+    with mapped(path) as data:
+        bounds = chunk_bounds(data, chunk_bytes)
+    starts = [start for start, _ in bounds]
+    ends = [end for _, end in bounds]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(chunk_totals, repeat(str(path)), starts, ends, repeat(k))
+        return merge_chunks(chunks, k)
+
+
+def part_one(input_str: InputData) -> int:
+    """get the max"""
+    return max(elf_totals(input_str))
+
+
+def part_two(input_str: InputData) -> int:
+    """get the sum of the top three"""
+    return sum(top_k(input_str, 3))
+
+
+test_input = """1000
+2000
+3000
+
+4000
+
+5000
+6000
+
+7000
+8000
+9000
+
+10000
+"""
+
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 24000
+    assert part_two(test_input) == 45000
+    assert top_k(test_input, 2) == [24000, 11000]
+    assert list(elf_totals(test_input.rstrip())) == [6000, 4000, 11000, 24000, 10000]
+
+
+if __name__ == "__main__":
+    self_check()
+    with mapped(Path(__file__).parent / "input.txt") as input_data:
+        print("max:", part_one(input_data))
+        print("top three sum:", part_two(input_data))
@@ -17,6 +17,11 @@ each cycle - if one of the sprite's pixels is the one being drawn, then we illum
 we leave it.
 
 """
+from pathlib import Path
+
+from aoc.inputs import InputData, iter_lines
+
+ACCEPTS_BYTES = True
 
 
 class CPU:
@@ -44,9 +49,9 @@ class CPU:
         """get the cycle number times the x value at that cycle number."""
         return cycle_number * self.x_history[cycle_number - 1]
 
-    def parse_input(self, input_str: str):
+    def parse_input(self, input_str: InputData):
         """Read the instruction set, find the x value over time."""
-        for line in input_str.splitlines():
+        for line in iter_lines(input_str):
             instr, *args = line.split()
             if instr == "addx":
                 self.addx(int(args[0]))
@@ -98,11 +103,6 @@ def part_two(input_str: str) -> int:
     return screen_output
 
 
-with open("test_input.txt") as flines:
-    test_input = flines.read()
-
-assert part_one(test_input) == 13140
-
 test_screen = """##..##..##..##..##..##..##..##..##..##..
 ###...###...###...###...###...###...###.
 ####....####....####....####....####....
@@ -111,12 +111,19 @@ test_screen = """##..##..##..##..##..##..##..##..##..##..
 #######.......#######.......#######.....
 """
 
-assert part_two(test_input) == test_screen
 
-# assert part_two(test_input_two) == 36
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    with open(Path(__file__).parent / "test_input.txt") as flines:
+        test_input = flines.read()
+
+    assert part_one(test_input) == 13140
+    assert part_two(test_input) == test_screen
+
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
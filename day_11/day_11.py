@@ -14,6 +14,7 @@ import re
 from typing import Callable
 from collections import deque
 from math import prod
+from pathlib import Path
 
 NUMBER_OF_ROUNDS = 20
 WORRY_REDUCTION = 3
@@ -151,12 +152,16 @@ Monkey 3:
     If false: throw to monkey 1
 """
 
-assert part_one(test_input) == 10605
-assert part_two(test_input) == 2713310158
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 10605
+    assert part_two(test_input) == 2713310158
 
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
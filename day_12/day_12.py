@@ -10,8 +10,12 @@ You can only move to a square <= 1 higher than the current one.
 import networkx as nx
 import numpy as np
 import string
+from pathlib import Path
 
+from aoc.cache import persist_parsed
 
+
+@persist_parsed("npz")
 def parse_input(input_str: str) -> tuple[np.array, tuple[int], tuple[int]]:
     """Return the grid as a 2d numpy integer array, and the start and end coordinates"""
     grid = np.array([list(x) for x in input_str.splitlines()])
@@ -114,12 +118,16 @@ accszExk
 acctuvwj
 abdefghi"""
 
-assert part_one(test_input) == 31
-assert part_two(test_input) == 29
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 31
+    assert part_two(test_input) == 29
 
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
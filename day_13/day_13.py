@@ -7,6 +7,9 @@ should be ordered.
 """
 from dataclasses import dataclass
 from itertools import zip_longest
+from pathlib import Path
+
+from aoc.cache import persist_parsed
 
 
 @dataclass
@@ -19,6 +22,7 @@ class Packet:
         return compare(self.raw_packet, other.raw_packet)
 
 
+@persist_parsed()
 def parse_input(input_str: str) -> list[tuple[list, list]]:
     """Generate a list of left/right pairs of nested lists."""
     packets = []
@@ -124,12 +128,16 @@ test_input = """[1,1,3,1,1]
 [1,[2,[3,[4,[5,6,7]]]],8,9]
 [1,[2,[3,[4,[5,6,0]]]],8,9]"""
 
-assert part_one(test_input) == 13
-assert part_two(test_input) == 140
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 13
+    assert part_two(test_input) == 140
 
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
@@ -10,12 +10,17 @@ if not either of those, then down and right.
 
 part one - how much sand falls before the system stabilises?
 """
+from pathlib import Path
+
 import numpy as np
 
+from aoc.cache import persist_parsed
+
 Point = tuple[int, int]
 SAND_COORDS = (500, 0)
 
 
+@persist_parsed()
 def parse_input(input_str: str) -> np.ndarray:
     # this is double-counting the intermediate points, but that's fine.
     coords = []
@@ -159,12 +164,16 @@ test_input = """498,4 -> 498,6 -> 496,6
 503,4 -> 502,4 -> 502,9 -> 494,9
 """
 
-assert part_one(test_input) == 24
-assert part_two(test_input) == 93
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 24
+    assert part_two(test_input) == 93
 
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
@@ -7,23 +7,31 @@ cannot be.
 Part one - find the exclusion zone for a given row.
 
 """
-import re
+from pathlib import Path
+
+import numpy as np
 from tqdm import tqdm
 
+from aoc.cache import persist_parsed
+from aoc.parsing import extract_ints
+
+ROW_NUMBER = 2_000_000
+SPACE_SIZE = 4_000_000
 
-def parse_input(input_str) -> list[tuple[(int, int), (int, int), int]]:
 
+@persist_parsed()
+def parse_input(input_str) -> list[tuple[(int, int), (int, int), int]]:
+    coords = extract_ints(input_str, per_line=4, signed=True)
+    distances = np.abs(coords[:, :2] - coords[:, 2:]).sum(axis=1)
     output = []
-    for line in input_str.splitlines():
-        sensor_x, sensor_y, beacon_x, beacon_y = [
-            int(x) for x in re.findall(r"-?\d+", line)
-        ]
-        distance = abs(sensor_x - beacon_x) + abs(sensor_y - beacon_y)
+    for (sensor_x, sensor_y, beacon_x, beacon_y), distance in zip(
+        coords.tolist(), distances.tolist()
+    ):
         output.append(((sensor_x, sensor_y), (beacon_x, beacon_y), distance))
     return output
 
 
-def part_one(input_str: str, row_number: int) -> int:
+def part_one(input_str: str, row_number: int = ROW_NUMBER) -> int:
     """
     Given a set of sensors and beacons, find the exclusion zone for each beacon
     and thus the places where the distress beacon cannot be for y=`row_number`.
@@ -103,7 +111,7 @@ def get_diamond(centre_point: tuple, distance: int, space_size):
     return [(x, y) for x, y in points if 0 <= x <= space_size and 0 <= y <= space_size]
 
 
-def part_two(input_str: str, space_size: int) -> int:
+def part_two(input_str: str, space_size: int = SPACE_SIZE) -> int:
     """Find the one place in the space not excluded.
 
     Copying from existing answers, we use the fact that our search space
@@ -146,13 +154,17 @@ Sensor at x=16, y=7: closest beacon is at x=15, y=3
 Sensor at x=14, y=3: closest beacon is at x=15, y=3
 Sensor at x=20, y=1: closest beacon is at x=15, y=3"""
 
-assert part_one(test_input, 10) == 26
-assert part_two(test_input, 20) == 56000011
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input, 10) == 26
+    assert part_two(test_input, 20) == 56000011
 
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
-    print("part one:", part_one(input_str, 2_000_000))
-    print("part two:", part_two(input_str, 4_000_000))
+    print("part one:", part_one(input_str))
+    print("part two:", part_two(input_str))
@@ -1,3 +1,13 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from aoc.cache import persist_parsed
+from aoc.inputs import InputData
+
+ACCEPTS_BYTES = True
+
 test_input = """A Y
 B X
 C Z
@@ -74,47 +84,119 @@ def score_hands_part_two(opponent_hand: Hand, desired_result: int) -> int:
     return score_hands(my_hand, opponent_hand)
 
 
-def parse_input(input_str) -> list[list[Hand]]:
-    games = []
-    for line in input_str.split("\n"):
-        line = line.strip()
-        if line:
-            opponent_hand, my_hand = line.split()
-            games.append([Hand(opponent_hand), Hand(my_hand)])
-    return games
-
+@dataclass(frozen=True)
+class Strategy:
+    """One way of reading the guide's X, Y and Z.
 
-def part_one(input_str: str) -> int:
+    `letters` gives what X, Y and Z mean in turn: the hand to play ("ABC" plays
+    rock for X, paper for Y, scissors for Z), or with outcome=True the result
+    wanted ("LDW" loses on X, draws on Y, wins on Z).
     """
-    parse the raw text into a list, then score the strategy.
-    """
-    games = parse_input(input_str)
-
-    score = sum(score_hands(my_hand=m, opponent_hand=o) for o, m in games)
 
-    return score
+    letters: str
+    outcome: bool = False
+
+    def __post_init__(self):
+        allowed = "LDW" if self.outcome else "ABC"
+        if len(self.letters) != 3 or not set(self.letters) <= set(allowed):
+            raise ValueError(f"expected three of {allowed}, got {self.letters!r}")
+
+    def table(self) -> np.ndarray:
+        """Score of every round as a 3x3 table: opponent's hand by X/Y/Z."""
+        if self.outcome:
+            return np.array(
+                [
+                    [
+                        score_hands_part_two(Hand(o), "LDW".index(x) + 1)
+                        for x in self.letters
+                    ]
+                    for o in "ABC"
+                ]
+            )
+        return np.array(
+            [[score_hands(Hand(x), Hand(o)) for x in self.letters] for o in "ABC"]
+        )
+
+
+PART_ONE_STRATEGY = Strategy("ABC")
+PART_TWO_STRATEGY = Strategy("LDW", outcome=True)
+
+
+@persist_parsed("npz")
+def parse_input(input_str: InputData) -> tuple[np.ndarray, np.ndarray]:
+    """Return each round's (opponent, me) letters as 0-2 index arrays."""
+    if isinstance(input_str, str):
+        input_str = input_str.encode()
+    chars = np.frombuffer(input_str, dtype=np.uint8)
+
+    # every line that isn't blank must be "<A-C> <X-Z>", give or take any
+    # whitespace around it: find each line's first and last non-space char.
+    newlines = np.flatnonzero(chars == ord("\n"))
+    printable = np.flatnonzero(chars > ord(" "))
+    if not len(printable):
+        return np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.uint8)
+    line_of = np.searchsorted(newlines, printable)
+    new_line = np.flatnonzero(np.diff(line_of)) + 1
+    starts = printable[np.concatenate(([0], new_line))]
+    ends = printable[np.concatenate((new_line - 1, [len(printable) - 1]))] + 1
+    if np.any(ends - starts != 3):
+        raise ValueError("expected lines like 'A Y'")
+
+    opponent, space, me = chars[starts[:, None] + np.arange(3)].T
+    if (
+        np.any((opponent < ord("A")) | (opponent > ord("C")))
+        or np.any(space != ord(" "))
+        or np.any((me < ord("X")) | (me > ord("Z")))
+    ):
+        raise ValueError("expected lines like 'A Y'")
+    return opponent - ord("A"), me - ord("X")
+
+
+def round_counts(input_str: InputData) -> np.ndarray:
+    """How many times each (opponent, X/Y/Z) pair comes up, as a 3x3 array."""
+    opponent, me = parse_input(input_str)
+    return np.bincount(opponent * 3 + me, minlength=9).reshape(3, 3)
+
+
+def score_strategies(input_str: InputData, strategies: list[Strategy]) -> list[int]:
+    """Total score of the guide under each strategy.
+
+    There are only nine kinds of round, so the input is read once into the
+    count of each, and every strategy's total is its table weighted by those.
+    """
+    if not strategies:
+        return []
+    tables = np.stack([strategy.table() for strategy in strategies])
+    return np.einsum("nij,ij->n", tables, round_counts(input_str)).tolist()
 
 
-def part_two(input_str: str) -> int:
+def part_one(input_str: InputData) -> int:
     """
-    Sadly little of the parsing carries over.
+    X, Y, Z are the hand to play.
     """
-    games = parse_input(input_str)
+    return score_strategies(input_str, [PART_ONE_STRATEGY])[0]
 
-    score_2 = sum(
-        score_hands_part_two(opponent_hand=o, desired_result=m.value) for o, m in games
-    )
 
-    return score_2
+def part_two(input_str: InputData) -> int:
+    """
+    X, Y, Z are the result wanted.
+    """
+    return score_strategies(input_str, [PART_TWO_STRATEGY])[0]
 
 
-assert part_one(test_input) == 15
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 15
+    assert part_two(test_input) == 12
+    assert score_strategies(
+        test_input, [PART_ONE_STRATEGY, Strategy("AAA"), Strategy("WWW", outcome=True)]
+    ) == [15, 12, 24]
 
-assert part_two(test_input) == 12
 
 if __name__ == "__main__":
+    self_check()
 
-    with open("input.txt") as flines:
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
@@ -5,79 +5,93 @@ each rucksack has two compartments with equal numbers of items.
 all items of a given type go in the same compartment.
 each item is a single letter.
 """
-from dataclasses import dataclass
+from pathlib import Path
 
+import numpy as np
+
+from aoc.cache import persist_parsed
+from aoc.inputs import InputData
+
+ACCEPTS_BYTES = True
 
 # map from char to number
 letter_to_score = {chr(x): i + 1 for i, x in enumerate(range(ord("a"), ord("z") + 1))}
 letter_to_score |= {chr(x): i + 27 for i, x in enumerate(range(ord("A"), ord("Z") + 1))}
 
+# a set of items is a 52-bit mask, with bit (score - 1) set for each item in it.
+ITEM_BITS = np.array(
+    [
+        1 << (letter_to_score[chr(x)] - 1) if chr(x) in letter_to_score else 0
+        for x in range(256)
+    ],
+    dtype=np.uint64,
+)
+
+
+@persist_parsed("npz")
+def parse_input(input_str: InputData) -> np.ndarray:
+    """Return an (N, 2) array of each rucksack's two compartments as item masks.
 
-@dataclass
-class RuckSack:
-    raw_input: str
-    compartment_one: str
-    compartment_two: str
-
-    def __post__init__(self):
-        assert len(self.compartment_one) == len(self.compartment_two)
-        assert self.compartment_one + self.compartment_two == self.raw_input
-
-    def get_common_letters(self):
-        common_letters = set()
-        for item in self.compartment_one:
-            if item in self.compartment_two:
-                common_letters.add(item)
-        return common_letters
-
-
-def parse_input(input_str: str) -> list[RuckSack]:
-    rucksacks = []
-    for line in input_str.split("\n"):
-        if not line:
-            continue
-        rucksacks.append(
-            RuckSack(
-                raw_input=line,
-                compartment_one=line[: len(line) // 2],
-                compartment_two=line[len(line) // 2 :],
-            )
-        )
-    return rucksacks
-
-
-def part_one(input_str: str) -> int:
+    Every char is looked up in ITEM_BITS at once, and each half-line is
+    OR-ed into its mask with one reduceat over the whole input.
+    """
+    if isinstance(input_str, str):
+        input_str = input_str.encode()
+    chars = np.frombuffer(input_str, dtype=np.uint8)
+    if not len(chars):
+        return np.zeros((0, 2), dtype=np.uint64)
+
+    bits = ITEM_BITS[chars]
+    is_line_end = (chars == ord("\n")) | (chars == ord("\r"))
+    if np.any((bits == 0) & ~is_line_end):
+        raise ValueError("rucksacks should only hold a-z and A-Z")
+
+    newlines = np.flatnonzero(chars == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(chars)]))
+    # drop any \r (an empty first line peeks at chars[-1], but is dropped anyway).
+    ends[chars[ends - 1] == ord("\r")] -= 1
+    starts, ends = starts[ends > starts], ends[ends > starts]
+    if np.any((ends - starts) % 2):
+        raise ValueError("rucksacks should have an even number of items")
+
+    # the second compartment runs on into the newline, but that ORs in nothing.
+    halves = np.stack((starts, (starts + ends) // 2), axis=1).ravel()
+    if not len(halves):
+        return np.zeros((0, 2), dtype=np.uint64)
+    return np.bitwise_or.reduceat(bits, halves).reshape(-1, 2)
+
+
+def single_item_scores(masks: np.ndarray) -> np.ndarray:
+    """Score of the one item in each mask: its bit position, plus one."""
+    if np.any((masks == 0) | (masks & (masks - np.uint64(1)) != 0)):
+        raise ValueError("expected exactly one item in each set")
+    # powers of two up to 2**51 are exact as floats, and frexp gives log2 + 1.
+    return np.frexp(masks.astype(np.float64))[1]
+
+
+def part_one(input_str: InputData) -> int:
     """find common items to both compartments, and score based on ordinal value.
 
     i.e: a-z = 1-26, A-Z = 27-52
     """
 
-    rucksacks = parse_input(input_str)
-
-    score = 0
-    for rucksack in rucksacks:
-        score += sum(letter_to_score[x] for x in rucksack.get_common_letters())
-    return score
+    compartments = parse_input(input_str)
+    common = compartments[:, 0] & compartments[:, 1]
+    return int(single_item_scores(common).sum())
 
 
-def part_two(input_str: str) -> int:
+def part_two(input_str: InputData) -> int:
     """
     Look at groups of three rucksacks, and find the item (char) common to all three.
     """
 
-    rucksacks = parse_input(input_str)
-
-    assert len(rucksacks) % 3 == 0
-    score = 0
-    for i in range(0, len(rucksacks), 3):
-        all_group_items = [x.raw_input for x in rucksacks[i : i + 3]]
-        for item in all_group_items[0]:
-            if item in all_group_items[1] and item in all_group_items[2]:
-                # there is only one item common to all three
-                badge = item
-                break
-        score += letter_to_score[badge]
-    return score
+    compartments = parse_input(input_str)
+    rucksacks = compartments[:, 0] | compartments[:, 1]
+    if len(rucksacks) % 3:
+        raise ValueError("rucksacks should come in groups of three")
+    badges = np.bitwise_and.reduce(rucksacks.reshape(-1, 3), axis=1)
+    return int(single_item_scores(badges).sum())
 
 
 test_input = """vJrwpWtwJgWrhcsFMMfFFhFp
@@ -88,14 +102,17 @@ ttgJtRGJQctTZtZT
 CrZsJsPPZsGzwwsLwLmpwMDw
 """
 
-assert part_one(test_input) == 157
 
-assert part_two(test_input) == 70
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 157
+    assert part_two(test_input) == 70
 
 
 if __name__ == "__main__":
+    self_check()
 
-    with open("input.txt") as flines:
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
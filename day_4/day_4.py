@@ -11,67 +11,167 @@ list all the times one of the pair is completely included
 by the other (e.g 2-3, 1-4, 1-4 includes 2-3).
 optional: find the overlap between the two and check for enclosure that way.
 """
-
 from dataclasses import dataclass
+from pathlib import Path
 
+import numpy as np
 
-@dataclass
-class Assignment:
-    lower_bound: int
-    upper_bound: int
+from aoc.cache import persist_parsed
+from aoc.inputs import InputData
+from aoc.parsing import extract_ints
+
+ACCEPTS_BYTES = True
 
-    @property
-    def assingment_size(self) -> int:
-        """4-6 is size 3"""
-        return self.upper_bound - self.lower_bound
 
+@persist_parsed("npz")
+def parse_input(input_str: InputData) -> np.ndarray:
+    """Return an (N, 4) array of lower-upper,lower-upper bounds, one row per pair."""
+    return extract_ints(input_str, per_line=4)
 
-def get_overlap(elf_1: Assignment, elf_2: Assignment) -> int:
-    overlap_lower = max(elf_1.lower_bound, elf_2.lower_bound)
-    overlap_upper = min(elf_1.upper_bound, elf_2.upper_bound)
-    # sometimes there is no overlap at all: -1 will indicate this.
-    overlap = max(-1, overlap_upper - overlap_lower)
-    return overlap
 
+@dataclass
+class PairOverlaps:
+    """How each pair of assignments overlaps, worked out for all pairs at once.
 
-def parse_input(input_str) -> list[list[Assignment]]:
-    output = []
-    for line in input_str.split("\n"):
-        if not line:
-            continue
-        left, right = line.split(",")
-        left = Assignment(*(int(x) for x in left.split("-")))
-        right = Assignment(*(int(x) for x in right.split("-")))
-        output.append([left, right])
-    return output
+    Every field has one entry per pair. Bounds are inclusive, so 2-4,4-6
+    overlap by one section.
+    """
 
+    contained: np.ndarray  # one assignment is wholly inside the other
+    overlapping: np.ndarray  # the assignments share at least one section
+    overlap_length: np.ndarray  # how many sections they share
+
+    @classmethod
+    def from_bounds(cls, bounds: np.ndarray) -> "PairOverlaps":
+        lower_1, upper_1, lower_2, upper_2 = np.asarray(bounds).reshape(-1, 4).T
+        overlap_length = np.maximum(
+            0, np.minimum(upper_1, upper_2) - np.maximum(lower_1, lower_2) + 1
+        )
+        contained = ((lower_1 <= lower_2) & (upper_2 <= upper_1)) | (
+            (lower_2 <= lower_1) & (upper_1 <= upper_2)
+        )
+        return cls(contained, overlap_length > 0, overlap_length)
 
-def part_one(input_str: str) -> int:
-    """count the pairs were one range completely encloses the other.
+    @property
+    def num_contained(self) -> int:
+        return int(np.count_nonzero(self.contained))
+
+    @property
+    def num_overlapping(self) -> int:
+        return int(np.count_nonzero(self.overlapping))
 
-    we could just check with min() and max() but we will instead get the
-    overlap and check if it equals the length of one pair (guessing that
-    part two will need this).
-    """
-    redundants = 0
-    assignments = parse_input(input_str)
-    for assignment_1, assignment_2 in assignments:
-        overlap = get_overlap(assignment_1, assignment_2)
-        if overlap == min(assignment_1.assingment_size, assignment_2.assingment_size):
-            redundants += 1
 
-    return redundants
+def analyse_pairs(input_str: InputData) -> PairOverlaps:
+    return PairOverlaps.from_bounds(parse_input(input_str))
 
 
-def part_two(input_str: str) -> int:
+@dataclass
+class _Node:
+    """A centered interval tree node: the assignments crossing `center`."""
+
+    center: int
+    lowers: np.ndarray  # lower bounds of the crossing assignments, ascending
+    ids_by_lower: np.ndarray
+    neg_uppers: np.ndarray  # minus their upper bounds, ascending
+    ids_by_upper: np.ndarray
+    left: "_Node | None"  # assignments wholly below center
+    right: "_Node | None"  # assignments wholly above center
+
+
+class SectionIndex:
+    """Every elf's assignment, indexed for queries across all of them at once.
+
+    Elf i is side i % 2 of pair i // 2 in parse_input's output. "Who covers
+    section s" walks a centered interval tree, and "who overlaps a-b" adds the
+    assignments starting inside a-b from a sorted array of lower bounds. Each
+    of the O(log n) tree levels does a searchsorted (rather than a Python
+    scan) to find its matches, so both take O(log^2 n + k) for k results.
+    """
+
+    def __init__(self, bounds: np.ndarray) -> None:
+        bounds = np.asarray(bounds).reshape(-1, 2)
+        self.lower, self.upper = bounds[:, 0], bounds[:, 1]
+        self._ids_by_lower = np.argsort(self.lower, kind="stable")
+        self._sorted_lower = self.lower[self._ids_by_lower]
+        self._sorted_upper = np.sort(self.upper)
+        self._root = self._build(np.arange(len(bounds)))
+
+    def _build(self, ids: np.ndarray) -> _Node | None:
+        # split at the median endpoint: at least one assignment crosses it, and
+        # neither side gets more than half of them.
+        if not len(ids):
+            return None
+        lower, upper = self.lower[ids], self.upper[ids]
+        center = int(np.floor(np.median(np.concatenate((lower, upper)))))
+        crossing = (lower <= center) & (center <= upper)
+
+        by_lower = np.argsort(lower[crossing], kind="stable")
+        by_upper = np.argsort(-upper[crossing], kind="stable")
+        return _Node(
+            center=center,
+            lowers=lower[crossing][by_lower],
+            ids_by_lower=ids[crossing][by_lower],
+            neg_uppers=-upper[crossing][by_upper],
+            ids_by_upper=ids[crossing][by_upper],
+            left=self._build(ids[upper < center]),
+            right=self._build(ids[lower > center]),
+        )
+
+    def covering(self, section: int) -> np.ndarray:
+        """Ids of the elves whose assignment includes `section`, in no set order."""
+        found = []
+        node = self._root
+        while node is not None:
+            if section < node.center:
+                # these all reach past section, so take those starting by it.
+                count = np.searchsorted(node.lowers, section, "right")
+                found.append(node.ids_by_lower[:count])
+                node = node.left
+            elif section > node.center:
+                count = np.searchsorted(node.neg_uppers, -section, "right")
+                found.append(node.ids_by_upper[:count])
+                node = node.right
+            else:
+                found.append(node.ids_by_lower)
+                break
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+    def overlapping(self, lower: int, upper: int) -> np.ndarray:
+        """Ids of the elves whose assignment shares a section with lower-upper."""
+        if upper < lower:
+            return np.zeros(0, dtype=np.int64)
+        # anything overlapping either covers `lower`, or starts inside the range.
+        start, end = np.searchsorted(self._sorted_lower, (lower, upper), "right")
+        return np.concatenate((self.covering(lower), self._ids_by_lower[start:end]))
+
+    def coverage(self) -> tuple[np.ndarray, np.ndarray]:
+        """How many elves cover each section, as a step function.
+
+        Returns (sections, depth): depth[i] elves cover every section from
+        sections[i] up to just before sections[i + 1]. It comes from one
+        sweep over the sorted start (+1) and end (-1) events.
+        """
+        events = np.concatenate((self.lower, self.upper + 1))
+        changes = np.concatenate((np.ones(len(self.lower)), -np.ones(len(self.upper))))
+        sections, which = np.unique(events, return_inverse=True)
+        depth = np.cumsum(np.bincount(which, weights=changes, minlength=len(sections)))
+        return sections, depth.astype(np.int64)
+
+    def depth_at(self, section: int) -> int:
+        """How many elves cover `section`: starts at or before it, minus ends before it."""
+        started = np.searchsorted(self._sorted_lower, section, "right")
+        ended = np.searchsorted(self._sorted_upper, section, "left")
+        return int(started - ended)
+
+
+def part_one(input_str: InputData) -> int:
+    """count the pairs were one range completely encloses the other."""
+    return analyse_pairs(input_str).num_contained
+
+
+def part_two(input_str: InputData) -> int:
     """Return the number of pairs with non-zero overlap"""
-    num_overlaps = 0
-    assignments = parse_input(input_str)
-    for assignment_1, assignment_2 in assignments:
-        overlap = get_overlap(assignment_1, assignment_2)
-        if overlap != -1:
-            num_overlaps += 1
-    return num_overlaps
+    return analyse_pairs(input_str).num_overlapping
 
 
 test_input = """2-4,6-8
@@ -82,12 +182,26 @@ test_input = """2-4,6-8
 2-6,4-8
 """
 
-assert part_one(test_input) == 2
-assert part_two(test_input) == 4
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 2
+    assert part_two(test_input) == 4
+    assert analyse_pairs(test_input).overlap_length.tolist() == [0, 0, 1, 5, 1, 3]
+
+    index = SectionIndex(parse_input(test_input))
+    assert sorted(index.covering(6)) == [1, 4, 6, 7, 8, 9, 10, 11]
+    assert sorted(index.overlapping(1, 3)) == [0, 2, 6, 7, 10]
+    sections, depth = index.coverage()
+    assert sections.tolist() == [2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert depth.tolist() == [4, 5, 7, 7, 8, 6, 4, 1, 0]
+    assert index.depth_at(6) == 8
+
 
 if __name__ == "__main__":
+    self_check()
 
-    with open("input.txt") as flines:
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
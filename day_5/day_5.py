@@ -17,11 +17,14 @@ move 1 from 1 to 2
 
 list the crates on top of each stack at the end of the procedure - e.g CMZ
 """
-
 from dataclasses import dataclass
 from itertools import zip_longest
+from pathlib import Path
 from string import ascii_uppercase
 
+from aoc.cache import persist_parsed
+from aoc.parsing import extract_ints
+
 
 # overkill, but assuming this needs more functionality later.
 @dataclass
@@ -43,11 +46,13 @@ class Instruction:
 PuzzleInput = tuple[list[Tower], list[Instruction]]
 
 
+@persist_parsed()
 def parse_input(input_str) -> PuzzleInput:
     crate_position_str, instruction_list_str = input_str.split("\n\n")
     # parse the crates
     crate_matrix = [line for line in crate_position_str.splitlines()]
-    num_towers = (len(crate_matrix[0]) + 1) // 4
+    # editors strip trailing whitespace, so count towers from the label row instead.
+    num_towers = len(crate_matrix[-1].split())
     towers = [[] for i in range(num_towers)]
     # each crate looks like [A] [D] so read the 2nd, 6th, etc chars
     for line in crate_matrix:
@@ -60,30 +65,71 @@ def parse_input(input_str) -> PuzzleInput:
 
     # parse the instruction set
     # NB changing the arg order in init will blow this up, its bad design.
-    instruction_list = []
-    for line in instruction_list_str.splitlines():
-        vals = [int(x) for x in line.split() if x.isnumeric()]
-        instruction_list.append(Instruction(*vals))
+    instruction_vals = extract_ints(instruction_list_str, per_line=3).tolist()
+    instruction_list = [Instruction(*vals) for vals in instruction_vals]
     return towers, instruction_list
 
 
 def process_instruction(
     tower_list: list[Tower], instruction: Instruction, move_in_batches: bool
 ) -> None:
-    """Here we move crates one at a time."""
-    vol = instruction.volume
-    source_index = instruction.source - 1  # zero-based indexing
-    dest_index = instruction.dest - 1
-    if move_in_batches:
-        crates_to_move = []
-        # add to stack then reorder - could also just split the list.
-        for _ in range(vol):
-            crates_to_move.append(tower_list[source_index].stack.pop())
-        tower_list[dest_index].stack += crates_to_move[::-1]
-    else:
-        for _ in range(vol):
-            crate = tower_list[source_index].stack.pop()
-            tower_list[dest_index].stack.append(crate)
+    """Move the top crates of one tower onto another.
+
+    The crates go over as one slice either way: moving them one at a time
+    (the CrateMover 9000) just lands the block upside down, while the
+    CrateMover 9001 keeps its order. Either way it's a couple of list copies,
+    however many crates move.
+    """
+    source = tower_list[instruction.source - 1].stack  # zero-based indexing
+    dest = tower_list[instruction.dest - 1].stack
+    start = len(source) - instruction.volume
+    if start < 0:
+        raise ValueError(f"can't move {instruction.volume} crates from {source}")
+    if source is dest:
+        # taking crates off a tower and putting them straight back changes nothing.
+        return
+
+    block = source[start:]
+    del source[start:]
+    dest += block if move_in_batches else block[::-1]
+
+
+def trace_top_crates(input_str: str, move_in_batches: bool) -> str:
+    """Find the crates on top at the end without moving any crates.
+
+    Each final top is followed backwards through the instructions, as a
+    (tower, depth below the top) pair, back to where it started. That's
+    O(towers x instructions), however tall the towers are.
+    """
+    tower_list, instruction_list = parse_input(input_str)
+
+    heights = [len(tower.stack) for tower in tower_list]
+    for instruction in instruction_list:
+        heights[instruction.source - 1] -= instruction.volume
+        heights[instruction.dest - 1] += instruction.volume
+        if heights[instruction.source - 1] < 0:
+            raise ValueError(f"not enough crates for {instruction}")
+
+    tops = []
+    for final_tower, height in enumerate(heights):
+        if not height:
+            continue
+        tower, depth = final_tower, 0
+        for instruction in reversed(instruction_list):
+            source, dest = instruction.source - 1, instruction.dest - 1
+            if source == dest:
+                continue  # a tower moved onto itself is unchanged
+            if tower == dest and depth < instruction.volume:
+                # it was in the moved block, which the 9000 turned upside down.
+                tower = source
+                if not move_in_batches:
+                    depth = instruction.volume - 1 - depth
+            elif tower == dest:
+                depth -= instruction.volume
+            elif tower == source:
+                depth += instruction.volume
+        tops.append(tower_list[tower].stack[-1 - depth])
+    return "".join(tops)
 
 
 def part_one(input_str: str) -> str:
@@ -125,12 +171,31 @@ move 2 from 2 to 1
 move 1 from 1 to 2
 """
 
-assert part_one(test_input) == "CMZ"
-assert part_two(test_input) == "MCD"
+# moving crates onto the tower they came from leaves it as it was.
+same_tower_input = """[A] [D]
+[B] [E]
+[C] [F]
+ 1   2
+
+move 2 from 1 to 1
+"""
+
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == "CMZ"
+    assert part_two(test_input) == "MCD"
+    assert part_one(same_tower_input) == part_two(same_tower_input) == "AD"
+    assert trace_top_crates(same_tower_input, move_in_batches=False) == "AD"
+    assert trace_top_crates(same_tower_input, move_in_batches=True) == "AD"
+    assert trace_top_crates(test_input, move_in_batches=False) == "CMZ"
+    assert trace_top_crates(test_input, move_in_batches=True) == "MCD"
+
 
 if __name__ == "__main__":
+    self_check()
 
-    with open("input.txt") as flines:
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
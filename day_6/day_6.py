@@ -5,22 +5,117 @@ find the sequence of four characters that are all different in the datastream,
 and return the position.
 
 """
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
 
+import numpy as np
 
-def find_distinct_chars(input_str: str, number_of_chars: int) -> int:
+from aoc.inputs import InputData, mapped
+
+ACCEPTS_BYTES = True
+CHUNK_BYTES = 1 << 18
+
+
+def window_starts(
+    chars: np.ndarray, offset: int, last_seen: np.ndarray, start: int
+) -> np.ndarray:
+    """For each byte, where the longest run of distinct bytes ending on it starts.
+
+    `chars` sits at `offset` in the stream, `start` is the run start carried
+    over from the bytes before it, and `last_seen` holds the last position of
+    each byte value so far (-1 if unseen); it's updated in place.
+
+    A run can't reach back past the previous copy of any byte in it, so the
+    start is a running max of (previous copy + 1). Previous copies come from
+    a stable sort by byte value, which is a linear-time radix sort for uint8.
     """
-    Find the first string position where the previous `number_of_chars` chars
-    are all different. No arg prepartion needed - the input is just a one-line string.
+    if not len(chars):
+        return np.zeros(0, dtype=np.int64)
+    positions = np.arange(offset, offset + len(chars))
+    order = np.argsort(chars, kind="stable")
+    sorted_chars, sorted_positions = chars[order], positions[order]
+
+    # within each byte value's group, the previous copy is the one before it.
+    first_in_group = np.concatenate(([True], sorted_chars[1:] != sorted_chars[:-1]))
+    previous = np.empty(len(chars), dtype=np.int64)
+    previous[order] = np.where(
+        first_in_group,
+        last_seen[sorted_chars],
+        np.concatenate(([-1], sorted_positions[:-1])),
+    )
+    last_in_group = np.concatenate((first_in_group[1:], [True]))
+    last_seen[sorted_chars[last_in_group]] = sorted_positions[last_in_group]
+
+    return np.maximum.accumulate(np.maximum(previous + 1, start))
+
+
+class MarkerDetector:
+    """Finds markers in a datastream fed to it a chunk at a time.
+
+    Only the last-seen table and the current run start carry between chunks,
+    so a window can straddle any number of them and the state stays the same
+    size however long the stream runs.
+
+        detector = MarkerDetector((4, 14))
+        for chunk in feed:
+            for size, positions in detector.feed(chunk).items():
+                ...
     """
-    for i in range(number_of_chars, len(input_str)):
-        chars = input_str[i - number_of_chars : i]
-        if len(chars) == len(set(chars)):  # concise, but probably suboptimal perf
-            return i
-    else:
-        raise ValueError("No four-char sequence found.")
 
+    def __init__(self, window_sizes: Iterable[int] = (4, 14)) -> None:
+        self.window_sizes = tuple(window_sizes)
+        self.position = 0  # bytes consumed so far
+        self._last_seen = np.full(256, -1, dtype=np.int64)
+        self._start = 0
+
+    def feed(self, chunk: bytes | bytearray | memoryview) -> dict[int, np.ndarray]:
+        """Consume `chunk`, and return every marker ending in it for each window size.
+
+        A marker is reported as its position in the whole stream, like the
+        puzzle answer: the number of bytes up to and including the window.
+        """
+        chars = np.frombuffer(chunk, dtype=np.uint8)
+        starts = window_starts(chars, self.position, self._last_seen, self._start)
+        ends = np.arange(self.position + 1, self.position + len(chars) + 1)
+        if len(chars):
+            self._start = int(starts[-1])
+        self.position += len(chars)
+        return {size: ends[ends - starts >= size] for size in self.window_sizes}
+
+
+def iter_markers(
+    stream: BinaryIO, window_sizes: Iterable[int] = (4, 14)
+) -> Iterator[tuple[int, int]]:
+    """Yield (window size, position) for every marker read from `stream`."""
+    detector = MarkerDetector(window_sizes)
+    while chunk := stream.read(CHUNK_BYTES):
+        for size, positions in detector.feed(chunk).items():
+            for position in positions.tolist():
+                yield size, position
+
+
+def find_distinct_chars(input_str: InputData, number_of_chars: int) -> int:
+    """
+    Find the first string position where the previous `number_of_chars` chars
+    are all different. No arg prepartion needed - the input is just a one-line string.
 
-def part_one(input_str: str) -> int:
+    The stream is scanned a chunk at a time, so bytes and mmaps of any size
+    work without decoding, in O(n) for any window size.
+    """
+    if isinstance(input_str, str):
+        input_str = input_str.encode()
+    detector = MarkerDetector([number_of_chars])
+    # release the view on the way out, or a mapped input can't be closed.
+    with memoryview(input_str) as data:
+        for offset in range(0, len(data), CHUNK_BYTES):
+            with data[offset : offset + CHUNK_BYTES] as chunk:
+                markers = detector.feed(chunk)[number_of_chars]
+            if len(markers):
+                return int(markers[0])
+    raise ValueError(f"No {number_of_chars}-char sequence found.")
+
+
+def part_one(input_str: InputData) -> int:
     """
     Find the start-of-packet marker in an input string.
 
@@ -30,7 +125,7 @@ def part_one(input_str: str) -> int:
     return find_distinct_chars(input_str, number_of_chars=4)
 
 
-def part_two(input_str: str) -> int:
+def part_two(input_str: InputData) -> int:
     """
     Find the start-of-message marker in an input string.
 
@@ -48,14 +143,24 @@ test_inputs = [
     ["zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 11, 26],
 ]
 
-for input, part_one_answer, part_two_answer in test_inputs:
-    assert part_one(input) == part_one_answer
-    assert part_two(input) == part_two_answer
 
-if __name__ == "__main__":
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    for input, part_one_answer, part_two_answer in test_inputs:
+        assert part_one(input) == part_one_answer
+        assert part_two(input) == part_two_answer
 
-    with open("input.txt") as flines:
-        input_str = flines.read()
+    # every marker, from a feed split mid-window.
+    detector = MarkerDetector((4, 14))
+    first, second = detector.feed(b"mjqjpqmgb"), detector.feed(b"ljsphdztnvjfqwrcgsmlb")
+    assert first[4].tolist() == [7, 8, 9] and not len(first[14])
+    assert second[4][:4].tolist() == [10, 11, 12, 13]
+    assert second[14].tolist() == [19, 25, 26, 27, 28, 29, 30]
+
+
+if __name__ == "__main__":
+    self_check()
 
-    print("part one:", part_one(input_str))
-    print("part two:", part_two(input_str))
+    with mapped(Path(__file__).parent / "input.txt") as input_data:
+        print("part one:", part_one(input_data))
+        print("part two:", part_two(input_data))
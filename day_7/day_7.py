@@ -9,6 +9,15 @@ ls
 
 Build the filesystem and determine the total size of each directory.
 """
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from aoc.inputs import InputData, iter_lines, mapped
 
 """
 idea: a Directory class, which has a size() property, and a contents attribute.
@@ -17,6 +26,7 @@ the sizes of their contents.
 
 Then run some tree traversal to grab the big dirs.
 """
+ACCEPTS_BYTES = True
 TOTAL_DISK_SIZE = 70_000_000
 FREE_SPACE_REQUIRED = 30_000_000
 LARGE_DIR_SIZE = 100_000
@@ -38,7 +48,8 @@ class Directory:
 
     @property
     def size(self) -> int:
-        return sum(x.size for x in self.contents.values())
+        # re-walks the subtree each time; directory_sizes does them all at once.
+        return directory_sizes(self)[-1]
 
     def __str__(self) -> str:
         return f"Directory {self.name} with contents: {list(self.contents.keys())}"
@@ -53,9 +64,9 @@ class File:
 
 
 class Terminal:
-    def __init__(self, history: str) -> None:
+    def __init__(self, history: InputData | Iterable[str]) -> None:
         self.current_dir: Directory | None = None
-        self.history = history
+        self.history = history  # the log, or anything yielding its lines
 
     def replay_history(self) -> Directory:
         """Replay the terminal history to generate a directory structure.
@@ -63,16 +74,28 @@ class Terminal:
         Inputs are a set of commands, marked by $. Parse the commands to track
         what dir you're in, and parse the output to populate the dirs.
 
+        The history is read a line at a time, so it can also be a bytes view
+        of the log or an open file, and each line of ls output is added as
+        soon as it's read.
+
         Returns:
             The final directory you inhabit.
         """
-        for term_section in self.history.split("$")[
-            1:
-        ]:  # drop the first (empty) command.
-            commands = term_section.split("\n")
-            command = commands[0].strip()
-            output = [x for x in commands[1:] if x]
-            self._parse_command(command, output)
+        if isinstance(self.history, InputData):
+            lines = iter_lines(self.history)
+        else:
+            lines = (line.rstrip("\r\n") for line in self.history)
+
+        listing = False
+        for line in lines:
+            if line.startswith("$"):
+                command = line[1:].strip()
+                listing = command == "ls"
+                self._parse_command(command, [])
+            elif line:
+                if not listing:
+                    raise ValueError("output from a command other than ls", line)
+                self._ls([line])
         return self.current_dir
 
     def _parse_command(self, command: str, output: list[str]):
@@ -122,50 +145,183 @@ class Terminal:
                 )
 
 
-def part_one(input_str: str) -> int:
-    """Parse the input string into a directory structure, then traverse to
-    find the directories smaller than `LARGE_DIR_SIZE`.
+class FlatTree:
+    """The same filesystem as flat arrays, for logs with millions of entries.
+
+    Directory i has parent dir_parent[i] (-1 for the root, which is 0) and
+    name names[dir_name[i]]; file j sits in directory file_parent[j]. Names
+    are interned into one table, and a directory always comes after its
+    parent, so sizes can be rolled up in one pass from the last directory back.
     """
-    terminal = Terminal(input_str)
-    _ = terminal.replay_history()
-    root = terminal.root_dir
-    # walk through the directories, looking for ones exceeding the size given.
-    small_dirs = []
 
-    def _traverse(dir):
-        for dir in dir.contents.values():
-            if isinstance(dir, Directory):
-                if dir.size < LARGE_DIR_SIZE:
-                    small_dirs.append([dir.name, dir.size])
-                _traverse(dir)
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._children: dict[int, int] = {}  # (parent, name id) -> directory
+        self._files: dict[int, int] = {}  # (parent, name id) -> file
+        self.dir_parent = array("q", [-1])
+        self.dir_name = array("q", [self.intern("/")])
+        self.file_parent = array("q")
+        self.file_name = array("q")
+        self.file_size = array("q")
+
+    def intern(self, name: str) -> int:
+        if name not in self._name_ids:
+            self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return self._name_ids[name]
+
+    def _child_key(self, parent: int, name: str) -> int:
+        return (parent << 32) | self.intern(name)
+
+    def add_dir(self, parent: int, name: str) -> int:
+        key = self._child_key(parent, name)
+        if key in self._children:
+            return self._children[key]
+        index = len(self.dir_parent)
+        self.dir_parent.append(parent)
+        self.dir_name.append(self.intern(name))
+        self._children[key] = index
+        return index
+
+    def add_file(self, parent: int, name: str, size: int) -> None:
+        key = self._child_key(parent, name)
+        if key in self._files:
+            self.file_size[self._files[key]] = size
+            return
+        self._files[key] = len(self.file_parent)
+        self.file_parent.append(parent)
+        self.file_name.append(self.intern(name))
+        self.file_size.append(size)
+
+    def child(self, parent: int, name: str) -> int:
+        """The directory called `name` in directory `parent`."""
+        return self._children[self._child_key(parent, name)]
+
+    def directory_sizes(self) -> np.ndarray:
+        """Size of every directory, indexed like dir_parent (so root is 0).
+
+        Files are summed into their directories in one go. Every directory
+        comes after its parent, so a single pass from the last directory back
+        adds each one into its parent after all its children are in.
+        """
+        file_sizes = np.zeros(len(self.dir_parent), dtype=np.int64)
+        np.add.at(file_sizes, np.asarray(self.file_parent), np.asarray(self.file_size))
+        sizes, parents = file_sizes.tolist(), self.dir_parent
+        for index in range(len(sizes) - 1, 0, -1):
+            sizes[parents[index]] += sizes[index]
+        return np.array(sizes, dtype=np.int64)
 
-    _traverse(root)
-    return sum(x[1] for x in small_dirs)
 
+class FlatTerminal(Terminal):
+    """A Terminal that replays the history into a FlatTree.
 
-def part_two(input_str: str) -> int:
-    """Parse the input string into a directory structure, then traverse to
-    find the smallest directory freeing up the space."""
+    The current directory is an index into the tree rather than a Directory.
+    """
 
-    terminal = Terminal(input_str)
-    _ = terminal.replay_history()
-    root = terminal.root_dir
-    # walk through the directories, pull all sizes
-    dir_sizes = []
+    def __init__(self, history: InputData | Iterable[str]) -> None:
+        super().__init__(history)
+        self.tree = FlatTree()
+
+    def _cd(self, directory: str):
+        if directory == "/":
+            assert self.current_dir is None
+            self.current_dir = self.root_dir = 0
+        elif directory == "..":
+            if self.current_dir == 0:
+                raise ValueError("can't cd .. from the root directory")
+            self.current_dir = self.tree.dir_parent[self.current_dir]
+        else:
+            self.current_dir = self.tree.child(self.current_dir, directory)
+
+    def _ls(self, file_contents: list[str]):
+        for file_content in file_contents:
+            file_size, file_name = file_content.split()
+            if file_size == "dir":
+                self.tree.add_dir(self.current_dir, file_name)
+            else:
+                self.tree.add_file(self.current_dir, file_name, int(file_size))
+
+
+def directory_sizes(directory: Directory) -> list[int]:
+    """Return the size of `directory` and every directory under it.
+
+    Sizes are worked out in one post-order pass: each directory's size is
+    summed from its children's, which are already done, so every file and
+    directory is only looked at once. `directory` itself comes last.
+    """
+    # walk with an explicit stack of [unvisited contents, size so far] frames,
+    # so deep trees don't hit the recursion limit.
+    sizes = []
+    stack = [[iter(directory.contents.values()), 0]]
+    while stack:
+        frame = stack[-1]
+        item = next(frame[0], None)
+        if item is None:
+            stack.pop()
+            sizes.append(frame[1])
+            if stack:
+                stack[-1][1] += frame[1]
+        elif isinstance(item, Directory):
+            stack.append([iter(item.contents.values()), 0])
+        else:
+            frame[1] += item.size
+    return sizes
 
-    def _traverse(dir):
-        for dir in dir.contents.values():
-            if isinstance(dir, Directory):
-                dir_sizes.append([dir.name, dir.size])
-                _traverse(dir)
 
-    _traverse(root)
+class SizeIndex:
+    """Directory sizes sorted once, to answer many space-planning questions.
 
-    current_space = TOTAL_DISK_SIZE - root.size
-    space_to_free = FREE_SPACE_REQUIRED - current_space
-    minimum_viable_size = sorted([y for x, y in dir_sizes if y >= space_to_free])[0]
+    Root counts towards the disk usage but isn't a candidate itself, as in
+    the puzzle. Both queries are a bisect into the sorted sizes, with a
+    prefix sum for the totals.
+    """
+
+    def __init__(self, dir_sizes: Iterable[int], root_size: int) -> None:
+        self.sizes = sorted(dir_sizes)
+        self.prefix_sums = [0, *accumulate(self.sizes)]
+        self.root_size = root_size
+
+    @classmethod
+    def from_history(cls, history: InputData | Iterable[str]) -> "SizeIndex":
+        terminal = FlatTerminal(history)
+        _ = terminal.replay_history()
+        root_size, *dir_sizes = terminal.tree.directory_sizes().tolist()
+        return cls(dir_sizes, root_size)
+
+    def total_below(self, limit: int) -> int:
+        """Total size of the directories smaller than `limit`."""
+        return self.prefix_sums[bisect_left(self.sizes, limit)]
+
+    def smallest_at_least(self, size: int) -> int | None:
+        """Size of the smallest directory of at least `size`, if there is one."""
+        index = bisect_left(self.sizes, size)
+        return self.sizes[index] if index < len(self.sizes) else None
+
+    def space_to_free(
+        self,
+        disk_size: int = TOTAL_DISK_SIZE,
+        space_required: int = FREE_SPACE_REQUIRED,
+    ) -> int:
+        current_space = disk_size - self.root_size
+        return space_required - current_space
+
+
+def part_one(input_str: InputData) -> int:
+    """Parse the input string into a directory structure, then sum the
+    directories smaller than `LARGE_DIR_SIZE`.
+    """
+    return SizeIndex.from_history(input_str).total_below(LARGE_DIR_SIZE)
 
-    return minimum_viable_size
+
+def part_two(input_str: InputData) -> int:
+    """Parse the input string into a directory structure, then find the
+    smallest directory freeing up the space."""
+    index = SizeIndex.from_history(input_str)
+    size = index.smallest_at_least(index.space_to_free())
+    if size is None:
+        raise ValueError("no directory frees up enough space")
+    return size
 
 
 test_input = """$ cd /
@@ -192,12 +348,33 @@ $ ls
 5626152 d.ext
 7214296 k"""
 
-assert part_one(test_input) == 95437
-assert part_two(test_input) == 24933642
 
-if __name__ == "__main__":
-    with open("input.txt") as flines:
-        input_str = flines.read()
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 95437
+    assert part_two(test_input) == 24933642
 
-    print("part one:", part_one(input_str))
-    print("part two:", part_two(input_str))
+    terminal = Terminal(test_input)
+    _ = terminal.replay_history()
+    assert directory_sizes(terminal.root_dir) == [584, 94853, 24933642, 48381165]
+
+    # listing a directory twice doesn't count its contents twice.
+    relisted = "$ cd /\n$ ls\ndir a\n100 b\n$ ls\ndir a\n100 b\n$ cd a\n$ ls\n50 c\n"
+    terminal = FlatTerminal(relisted)
+    _ = terminal.replay_history()
+    assert terminal.tree.directory_sizes().tolist() == [150, 50]
+
+    index = SizeIndex.from_history(test_input)
+    assert index.total_below(100_000) == 95437
+    assert index.total_below(1_000) == 584
+    assert (
+        index.smallest_at_least(index.space_to_free(space_required=21_700_000)) == 94853
+    )
+    assert index.smallest_at_least(25_000_000) is None
+
+
+if __name__ == "__main__":
+    self_check()
+    with mapped(Path(__file__).parent / "input.txt") as input_data:
+        print("part one:", part_one(input_data))
+        print("part two:", part_two(input_data))
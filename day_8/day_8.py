@@ -6,9 +6,12 @@ are visible from outside the grid when looking directly along a row or column.
 
 Then find the max 'scenic score' accounting for the number of visible trees.
 """
+from pathlib import Path
 
 import numpy as np
 
+from aoc.cache import persist_parsed
+
 
 class Forest:
     """Holds trees, and visiblity checker method"""
@@ -16,6 +19,7 @@ class Forest:
     def __init__(self, input_str: str) -> None:
         self.tree_grid: np.ndarray = self._parse_input(input_str)
 
+    @persist_parsed("npz")
     def _parse_input(self, input_str: str) -> np.ndarray:
         grid = [list(map(int, line)) for line in input_str.splitlines()]
         return np.array(grid, dtype="i8")
@@ -124,11 +128,16 @@ test_input = """30373
 35390
 """
 
-assert part_one(test_input) == 21
-assert part_two(test_input) == 8
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 21
+    assert part_two(test_input) == 8
+
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))
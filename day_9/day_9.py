@@ -12,6 +12,12 @@ direction. Otherwise, if they aren't touching and aren't in the same row or
 column, the tail moves one step diagonally.
 """
 from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.cache import persist_parsed
+from aoc.inputs import InputData, iter_lines
+
+ACCEPTS_BYTES = True
 
 
 def cast_to_magnitude(input_int: int) -> int:
@@ -60,10 +66,11 @@ class Translation:
     magnitude: int
 
 
-def parse_input(input_str: str) -> list[Translation]:
+@persist_parsed()
+def parse_input(input_str: InputData) -> list[Translation]:
     """convert a newline-separated string into a list of 2d translations."""
     translations = []
-    for line in input_str.splitlines():
+    for line in iter_lines(input_str):
         direction, magnitude = line.split()
         magnitude = int(magnitude)
         match direction:
@@ -120,8 +127,6 @@ L 5
 R 2
 """
 
-assert part_one(test_input) == 13
-
 test_input_two = """R 5
 U 8
 L 8
@@ -131,10 +136,17 @@ D 10
 L 25
 U 20
 """
-assert part_two(test_input_two) == 36
+
+
+def self_check() -> None:
+    """Run the worked examples from the puzzle statement."""
+    assert part_one(test_input) == 13
+    assert part_two(test_input_two) == 36
+
 
 if __name__ == "__main__":
-    with open("input.txt") as flines:
+    self_check()
+    with open(Path(__file__).parent / "input.txt") as flines:
         input_str = flines.read()
 
     print("part one:", part_one(input_str))